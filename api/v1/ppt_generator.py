@@ -14,5 +14,5 @@ async def generate_ppt(data:dict):
 
 @router.post("/generate")
 async def generate_ai_json(message:Message):
-    ppt_json = call_llm(message.message)
+    ppt_json = await call_llm(message.message)
     return {"data":ppt_json}
\ No newline at end of file
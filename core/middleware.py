@@ -1,7 +1,7 @@
 from datetime import datetime, timezone
 import time
 import uuid
-from fastapi import Response
+from starlette.datastructures import MutableHeaders
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.requests import Request
 from opentelemetry import trace
@@ -23,14 +23,27 @@ def add_cors_middleware(app):
         allow_headers=["Authorization"],
     )
 
-def add_logging_middleware(app):
-    """Middleware to log incoming requests efficiently"""
-    def format_timestamp(timestamp):
-        return datetime.fromtimestamp(timestamp, timezone.utc).isoformat(timespec="milliseconds") + "Z"
+def format_timestamp(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat(timespec="milliseconds") + "Z"
+
+
+class RequestLoggingMiddleware:
+    """Plain ASGI middleware that logs each request and its response.
+
+    Runs in the request's own task and hooks the response start message,
+    avoiding BaseHTTPMiddleware's extra task and body stream per request.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    @app.middleware("http")
-    async def log_requests(request: Request, call_next):        
         start_time = time.time()
+        request = Request(scope)
 
         # Get or generate trace_id and request_id
         trace_id = request.headers.get("X-Trace-ID", str(uuid.uuid4()))
@@ -51,40 +64,41 @@ def add_logging_middleware(app):
             request_headers=dict(request.headers),
         )
 
-        response: Response = await call_next(request)
-        # Adding CSP
-        # response.headers["Content-Security-Policy"] = (
-        #     "default-src 'self'; script-src 'self'; object-src 'none'; frame-ancestors 'none';"
-        # )
-        # # Adding X-content-type-options
-        # response.headers["X-Content-Type-Options"] = "nosniff"
-        # # Adding STS 
-        # response.headers["Strict-Transport-Security"] = "max-age=63072000; includeSubDomains; preload"
-
-        # Remove unwanted headers
-        if "server" in response.headers:
-            del response.headers["server"]
-        end_time = time.time()
-        duration = round((end_time - start_time) * 1000, 2)
-
-        # Log the response
-        log_kwargs = {
-            "start_time": format_timestamp(start_time),
-            "end_time": format_timestamp(end_time),
-            "duration_ms": duration,
-            "status_code": response.status_code,
-            "response_headers": dict(response.headers)
-        }
-
-        if response.status_code >= 500:
-            app_logger.error(API_REQUEST_PROCESSED, **log_kwargs)
-        elif response.status_code >= 400:
-            app_logger.warning(API_REQUEST_PROCESSED, **log_kwargs)
-        else:
-            app_logger.info(API_REQUEST_PROCESSED, **log_kwargs)
-
-        # Add trace and request IDs to response headers
-        response.headers["X-Trace-ID"] = trace_id
-        response.headers["X-Request-ID"] = request_id
-
-        return response
+        async def send_with_logging(message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+
+                # Remove unwanted headers
+                if "server" in headers:
+                    del headers["server"]
+                end_time = time.time()
+                duration = round((end_time - start_time) * 1000, 2)
+                status_code = message["status"]
+
+                # Log the response
+                log_kwargs = {
+                    "start_time": format_timestamp(start_time),
+                    "end_time": format_timestamp(end_time),
+                    "duration_ms": duration,
+                    "status_code": status_code,
+                    "response_headers": dict(headers)
+                }
+
+                if status_code >= 500:
+                    app_logger.error(API_REQUEST_PROCESSED, **log_kwargs)
+                elif status_code >= 400:
+                    app_logger.warning(API_REQUEST_PROCESSED, **log_kwargs)
+                else:
+                    app_logger.info(API_REQUEST_PROCESSED, **log_kwargs)
+
+                # Add trace and request IDs to response headers
+                headers["X-Trace-ID"] = trace_id
+                headers["X-Request-ID"] = request_id
+            await send(message)
+
+        await self.app(scope, receive, send_with_logging)
+
+
+def add_logging_middleware(app):
+    """Middleware to log incoming requests efficiently"""
+    app.add_middleware(RequestLoggingMiddleware)
@@ -8,11 +8,14 @@ Features:
 - Parallel processing with configurable batch size (default: 16)
 - Automatic retry on failures
 - Progress tracking
+- Optional --batch mode using the OpenAI Batch API for offline regeneration
 """
 
+import argparse
 import json
 import os
 import base64
+import random
 from pathlib import Path
 from typing import List, Dict, Tuple
 import time
@@ -26,71 +29,285 @@ except ImportError:
     exit(1)
 
 
+# Prompt sent with every cover image
+PROMPT = """Analyze this PowerPoint cover slide background image and provide a concise description (2-3 sentences max) that includes:
+1. The main subject/theme (e.g., business meeting, technology, nature, cityscape, abstract)
+2. The dominant colors and mood (e.g., professional blue tones, warm and energetic, minimalist and modern)
+3. The best use case (e.g., suitable for corporate presentations, tech startups, creative projects, financial reports)
+
+Be specific and practical to help users choose the right cover for their presentation content.
+Format: Just provide the description directly, no labels or prefixes."""
+
+# Text part of the user message, shared by all requests
+_TEXT_PART = {"type": "text", "text": PROMPT}
+
+
+def save_index(index_path: Path, index_data: Dict) -> None:
+    """Write index.json; json.dump streams the encoding, so no full JSON string is built."""
+    with open(index_path, 'w', encoding='utf-8') as f:
+        json.dump(index_data, f, indent=2, ensure_ascii=False)
+
+
 def encode_image_to_base64(image_path: Path) -> str:
     """Encode image to base64 string for API submission."""
     with open(image_path, "rb") as image_file:
         return base64.b64encode(image_file.read()).decode('utf-8')
 
 
-def analyze_cover_image(client: OpenAI, image_path: Path, cover_id: int, max_retries: int = 3) -> Tuple[int, str, bool]:
+def image_stamp(image_path: Path) -> List[int]:
+    """Size and mtime of an image, stored next to its uploaded file id to detect changes."""
+    stat = image_path.stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def cached_file_id(cover: Dict, stamp: List[int]) -> str:
+    """Return the cover's uploaded file id if it was uploaded from the image as it is now."""
+    if cover.get('openai_file_stamp') == stamp:
+        return cover.get('openai_file_id')
+    return None
+
+
+def upload_cover_image(client: OpenAI, image_path: Path) -> str:
+    """Upload a cover image once via the Files API and return its file id."""
+    with open(image_path, "rb") as image_file:
+        uploaded = client.files.create(file=image_file, purpose="vision")
+    return uploaded.id
+
+
+def analyze_cover_image(
+    client: OpenAI,
+    image_path: Path,
+    cover_id: int,
+    max_retries: int = 3,
+    file_id: str = None
+) -> Tuple[int, str, bool, str]:
     """
     Use GPT-4 Vision to analyze a cover image and generate a description.
+    The image is referenced by an uploaded file id rather than inlined as base64,
+    so retries and later runs don't resend the image bytes.
     
     Args:
         client: OpenAI client instance
         image_path: Path to the cover image
         cover_id: Cover ID number
         max_retries: Maximum number of retry attempts
+        file_id: Previously uploaded file id for this image (uploaded if None)
         
     Returns:
-        Tuple of (cover_id, description, success)
+        Tuple of (cover_id, description, success, file_id); file_id is None on failure
     """
-    # Encode image
-    base64_image = encode_image_to_base64(image_path)
-    
-    # Create the prompt
-    prompt = """Analyze this PowerPoint cover slide background image and provide a concise description (2-3 sentences max) that includes:
-1. The main subject/theme (e.g., business meeting, technology, nature, cityscape, abstract)
-2. The dominant colors and mood (e.g., professional blue tones, warm and energetic, minimalist and modern)
-3. The best use case (e.g., suitable for corporate presentations, tech startups, creative projects, financial reports)
-
-Be specific and practical to help users choose the right cover for their presentation content.
-Format: Just provide the description directly, no labels or prefixes."""
-    
     for attempt in range(max_retries):
         try:
-            response = client.chat.completions.create(
+            if file_id is None:
+                file_id = upload_cover_image(client, image_path)
+            
+            response = client.responses.create(
                 model="gpt-4o-mini",  # Fast and cost-effective model with vision
-                messages=[
+                input=[
                     {
                         "role": "user",
                         "content": [
+                            {"type": "input_text", "text": PROMPT},
                             {
-                                "type": "text",
-                                "text": prompt
-                            },
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:image/jpeg;base64,{base64_image}",
-                                    "detail": "low"  # Use "low" for faster/cheaper processing
-                                }
+                                "type": "input_image",
+                                "file_id": file_id,
+                                "detail": "low"  # Use "low" for faster/cheaper processing
                             }
                         ]
                     }
                 ],
-                max_tokens=150
+                max_output_tokens=150
             )
             
-            description = response.choices[0].message.content.strip()
-            return (cover_id, description, True)
+            description = response.output_text.strip()
+            return (cover_id, description, True, file_id)
             
         except Exception as e:
+            # The file may have expired or been deleted; upload afresh on the next attempt
+            file_id = None
             if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)  # Exponential backoff
+                # Exponential backoff with jitter so parallel workers don't retry in lockstep
+                time.sleep(random.uniform(0.5, 1.5) * (2 ** attempt))
                 continue
             else:
-                return (cover_id, f"Error: {str(e)}", False)
+                return (cover_id, f"Error: {str(e)}", False, None)
+
+
+def collect_covers_to_process(index_data: Dict, images_dir: Path, start_from: int = 1, limit: int = None) -> List[Tuple[int, Path]]:
+    """
+    Select the (cover_id, image_path) pairs to describe.
+    
+    Args:
+        index_data: Parsed index.json
+        images_dir: Path to images directory
+        start_from: Cover ID to start from
+        limit: Maximum number of covers to return (None for all)
+        
+    Returns:
+        List of (cover_id, image_path) tuples
+    """
+    covers_to_process = []
+    for cover in index_data['covers']:
+        cover_id = cover['id']
+        
+        # Skip if before start_from
+        if cover_id < start_from:
+            continue
+        
+        # Check limit
+        if limit and len(covers_to_process) >= limit:
+            break
+        
+        image_filename = cover['image']
+        image_path = images_dir / image_filename
+        
+        if not image_path.exists():
+            print(f"  Warning: Image not found: {image_path}")
+            continue
+        
+        covers_to_process.append((cover_id, image_path))
+    
+    return covers_to_process
+
+
+def build_batch_request(cover_id: int, image_path: Path) -> Dict:
+    """Build one Batch API request line for a cover image."""
+    base64_image = encode_image_to_base64(image_path)
+    return {
+        "custom_id": f"cover_{cover_id}",
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": {
+            "model": "gpt-4o-mini",
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [
+                        _TEXT_PART,
+                        {
+                            "type": "image_url",
+                            "image_url": {
+                                "url": f"data:image/jpeg;base64,{base64_image}",
+                                "detail": "low"
+                            }
+                        }
+                    ]
+                }
+            ],
+            "max_tokens": 150
+        }
+    }
+
+
+def report_batch_errors(client: OpenAI, batch) -> int:
+    """Print each request listed in the batch's error file and return how many there were."""
+    if not batch.error_file_id:
+        return 0
+    
+    errors = 0
+    for line in client.files.content(batch.error_file_id).text.splitlines():
+        if not line.strip():
+            continue
+        result = json.loads(line)
+        response = result.get("response") or {}
+        error = result.get("error") or (response.get("body") or {}).get("error")
+        print(f"  ✗ {result.get('custom_id')}: {error}")
+        errors += 1
+    return errors
+
+
+def update_index_with_batch(
+    index_path: Path,
+    images_dir: Path,
+    api_key: str,
+    start_from: int = 1,
+    limit: int = None,
+    poll_interval: int = 30
+):
+    """
+    Update index.json using the OpenAI Batch API instead of live requests.
+    Slower to complete, but cheaper and not bound by per-request rate limits,
+    which suits regenerating the whole index offline.
+    
+    Args:
+        index_path: Path to index.json
+        images_dir: Path to images directory
+        api_key: OpenAI API key
+        start_from: Cover ID to start from
+        limit: Maximum number of covers to process (None for all)
+        poll_interval: Seconds between batch status checks
+    """
+    client = OpenAI(api_key=api_key)
+    
+    print(f"Loading index from: {index_path}")
+    with open(index_path, 'r', encoding='utf-8') as f:
+        index_data = json.load(f)
+    
+    covers_dict = {cover['id']: cover for cover in index_data['covers']}
+    covers_to_process = collect_covers_to_process(index_data, images_dir, start_from, limit)
+    if not covers_to_process:
+        print("No covers to process")
+        return
+    
+    # Write one request per line
+    batch_input_path = index_path.parent / "batch_input.jsonl"
+    with open(batch_input_path, 'w', encoding='utf-8') as f:
+        for cover_id, image_path in covers_to_process:
+            f.write(json.dumps(build_batch_request(cover_id, image_path)) + "\n")
+    print(f"Wrote {len(covers_to_process)} requests to: {batch_input_path}")
+    
+    # Upload and submit
+    with open(batch_input_path, 'rb') as f:
+        batch_file = client.files.create(file=f, purpose="batch")
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+    print(f"Submitted batch {batch.id}")
+    
+    # Poll until the batch reaches a terminal state
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        time.sleep(poll_interval)
+        batch = client.batches.retrieve(batch.id)
+        # request_counts is not populated until the batch has been validated
+        counts = batch.request_counts
+        progress = f" | Completed: {counts.completed}/{counts.total}" if counts else ""
+        print(f"  Status: {batch.status}{progress}")
+    
+    # Requests that failed outright are reported in a separate error file
+    failed = report_batch_errors(client, batch)
+    
+    if batch.status != "completed" or not batch.output_file_id:
+        print(f"✗ Batch {batch.id} ended with status: {batch.status}")
+        return
+    
+    # Merge results back into the index
+    successful = 0
+    output = client.files.content(batch.output_file_id).text
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        result = json.loads(line)
+        cover_id = int(result["custom_id"].split("_", 1)[1])
+        response = result.get("response") or {}
+        if response.get("status_code") == 200:
+            description = response["body"]["choices"][0]["message"]["content"].strip()
+            covers_dict[cover_id]['description'] = description
+            successful += 1
+        else:
+            failed += 1
+            print(f"  ✗ Cover {cover_id:02d}: {result.get('error')}")
+    
+    print(f"\nSaving updated index to: {index_path}")
+    save_index(index_path, index_data)
+    
+    print(f"\n{'='*60}")
+    print(f"✓ Batch Complete!")
+    print(f"{'='*60}")
+    print(f"  Successful: {successful}")
+    print(f"  Failed: {failed}")
+    print(f"{'='*60}")
 
 
 def update_index_with_descriptions(
@@ -129,30 +346,14 @@ def update_index_with_descriptions(
     print(f"Batch size: {batch_size} parallel requests\n")
     
     # Prepare list of covers to process
-    covers_to_process = []
-    for cover in index_data['covers']:
-        cover_id = cover['id']
-        
-        # Skip if before start_from
-        if cover_id < start_from:
-            continue
-        
-        # Check limit
-        if limit and len(covers_to_process) >= limit:
-            break
-        
-        image_filename = cover['image']
-        image_path = images_dir / image_filename
-        
-        if not image_path.exists():
-            print(f"  Warning: Image not found: {image_path}")
-            continue
-        
-        covers_to_process.append((cover_id, image_path))
+    covers_to_process = collect_covers_to_process(index_data, images_dir, start_from, limit)
     
     total_to_process = len(covers_to_process)
     print(f"Processing {total_to_process} covers...\n")
     
+    # Taken before uploading, so a stored file id always matches the bytes it was uploaded from
+    stamps = {cover_id: image_stamp(image_path) for cover_id, image_path in covers_to_process}
+    
     # Process covers in parallel
     successful = 0
     failed = 0
@@ -161,7 +362,10 @@ def update_index_with_descriptions(
     with ThreadPoolExecutor(max_workers=batch_size) as executor:
         # Submit all tasks
         future_to_cover = {
-            executor.submit(analyze_cover_image, client, image_path, cover_id): cover_id
+            executor.submit(
+                analyze_cover_image, client, image_path, cover_id,
+                file_id=cached_file_id(covers_dict[cover_id], stamps[cover_id])
+            ): cover_id
             for cover_id, image_path in covers_to_process
         }
         
@@ -169,7 +373,15 @@ def update_index_with_descriptions(
         for i, future in enumerate(as_completed(future_to_cover), 1):
             cover_id = future_to_cover[future]
             try:
-                result_id, description, success = future.result()
+                result_id, description, success, file_id = future.result()
+                
+                # Remember the uploaded file only once it has worked, so later runs can reuse it
+                if success:
+                    covers_dict[result_id]['openai_file_id'] = file_id
+                    covers_dict[result_id]['openai_file_stamp'] = stamps[result_id]
+                else:
+                    covers_dict[result_id].pop('openai_file_id', None)
+                    covers_dict[result_id].pop('openai_file_stamp', None)
                 
                 if success:
                     # Update the cover description
@@ -198,8 +410,7 @@ def update_index_with_descriptions(
     
     # Save updated index
     print(f"\nSaving updated index to: {index_path}")
-    with open(index_path, 'w', encoding='utf-8') as f:
-        json.dump(index_data, f, indent=2, ensure_ascii=False)
+    save_index(index_path, index_data)
     
     total_time = time.time() - start_time
     
@@ -215,6 +426,11 @@ def update_index_with_descriptions(
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Generate AI descriptions for cover images.")
+    parser.add_argument("--batch", action="store_true",
+                        help="Submit all covers through the OpenAI Batch API (cheaper, completes within 24h).")
+    args = parser.parse_args()
+    
     # Configuration
     project_root = Path("/Users/ahmshalan/Projects/mobifly/ppt-generate")
     index_path = project_root / "branding/covers/index.json"
@@ -233,6 +449,17 @@ def main():
     print("="*60)
     print()
     
+    if args.batch:
+        # Offline regeneration through the Batch API
+        update_index_with_batch(
+            index_path=index_path,
+            images_dir=images_dir,
+            api_key=api_key,
+            start_from=1,
+            limit=None
+        )
+        return
+    
     # Process all covers
     # You can add parameters:
     # - start_from=10 to resume from cover 10
@@ -13,7 +13,7 @@ Requirements:
 import json
 import base64
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Tuple
 import time
 import requests
 
@@ -78,26 +78,42 @@ Be specific and practical to help users choose the right cover for their present
         return "Standard title with subtitle cover"
 
 
-def check_ollama_running() -> bool:
-    """Check if Ollama service is running."""
-    try:
-        response = requests.get('http://localhost:11434/api/tags', timeout=5)
-        return response.status_code == 200
-    except:
-        return False
+# Cached result of probe_ollama(), keyed by model name
+_OLLAMA_STATUS: Dict[str, Tuple[bool, bool]] = {}
 
 
-def check_model_available(model: str = "llava") -> bool:
-    """Check if the specified model is available in Ollama."""
+def probe_ollama(model: str = "llava") -> Tuple[bool, bool]:
+    """
+    Check Ollama with a single /api/tags request.
+    
+    Returns:
+        Tuple of (running, model_available); cached for the rest of the run
+    """
+    if model in _OLLAMA_STATUS:
+        return _OLLAMA_STATUS[model]
+    
+    status = (False, False)
     try:
         response = requests.get('http://localhost:11434/api/tags', timeout=5)
         if response.status_code == 200:
             models = response.json().get('models', [])
-            model_names = [m['name'].split(':')[0] for m in models]
-            return model in model_names
+            model_names = {m['name'].split(':')[0] for m in models}
+            status = (True, model in model_names)
     except:
-        return False
-    return False
+        pass
+    
+    _OLLAMA_STATUS[model] = status
+    return status
+
+
+def check_ollama_running() -> bool:
+    """Check if Ollama service is running."""
+    return probe_ollama()[0]
+
+
+def check_model_available(model: str = "llava") -> bool:
+    """Check if the specified model is available in Ollama."""
+    return probe_ollama(model)[1]
 
 
 def update_index_with_descriptions(
@@ -117,8 +133,10 @@ def update_index_with_descriptions(
         start_from: Cover ID to start from (useful for resuming)
         limit: Maximum number of covers to process (None for all)
     """
+    running, model_available = probe_ollama(model)
+    
     # Check if Ollama is running
-    if not check_ollama_running():
+    if not running:
         print("❌ Error: Ollama is not running!")
         print("\nTo start Ollama, run:")
         print("  ollama serve")
@@ -126,7 +144,7 @@ def update_index_with_descriptions(
         return
     
     # Check if model is available
-    if not check_model_available(model):
+    if not model_available:
         print(f"❌ Error: Model '{model}' not found!")
         print(f"\nTo install the {model} model, run:")
         print(f"  ollama pull {model}")
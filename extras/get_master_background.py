@@ -6,10 +6,13 @@ Extract slide master background color
 from pptx import Presentation
 from pptx.util import Pt
 
+# Precomputed two-digit hex strings for each channel value
+_HEX = tuple(f"{i:02X}" for i in range(256))
+
 def rgb_to_hex(rgb_color):
     """Convert RGB color to hex"""
     try:
-        return f"#{rgb_color[0]:02X}{rgb_color[1]:02X}{rgb_color[2]:02X}"
+        return "#" + _HEX[rgb_color[0]] + _HEX[rgb_color[1]] + _HEX[rgb_color[2]]
     except:
         return None
 
@@ -5,43 +5,168 @@ Automatically adjusts grid positioning to prevent overlapping components.
 """
 
 import json
+import logging
+from bisect import bisect_left
+from heapq import heappop, heappush
 from typing import Dict, List, Any, Tuple, Optional
-from dataclasses import dataclass
-from copy import deepcopy
+from dataclasses import dataclass, field
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Component types that place_rect never moves horizontally
+LOCKED_TYPES = ("image", "chart", "table")
+
+# detect_overlap_indices compares all pairs directly below this many rects
+PAIRWISE_OVERLAP_MAX = 16
+
+# Reference slide width in px (16:9) used to weigh columns against heights in maxrects
+REFERENCE_SLIDE_WIDTH = 1280
+
+# A free region as (first_col, end_col_exclusive, top_y, bottom_y)
+FreeRect = Tuple[int, int, float, float]
+
+
+@dataclass(slots=True)
 class GridRect:
-    """Represents a grid rectangle with position and dimensions."""
+    """Represents a grid rectangle with position and dimensions.
+    end_col and bottom_y are derived once at construction; use move_to()
+    rather than changing col/y directly.
+    """
     col: int
     span: int
     y: float
     row_h: float
     component_id: str
     component_type: str
+    end_col: int = field(init=False)
+    bottom_y: float = field(init=False)
     
-    @property
-    def end_col(self) -> int:
-        return self.col + self.span - 1
+    def __post_init__(self):
+        self.end_col = self.col + self.span - 1
+        self.bottom_y = self.y + self.row_h
     
-    @property
-    def bottom_y(self) -> float:
-        return self.y + self.row_h
+    def move_to(self, col: int, y: float):
+        """Reposition in place, keeping the derived edges in sync."""
+        self.col = col
+        self.y = y
+        self.end_col = col + self.span - 1
+        self.bottom_y = y + self.row_h
     
     def overlaps_with(self, other: 'GridRect', margin: float = 0) -> bool:
         """Check if this rectangle overlaps with another rectangle."""
-        # Check horizontal overlap
-        horizontal_overlap = not (self.end_col < other.col or other.end_col < self.col)
-        
-        # Check vertical overlap (with optional margin)
-        vertical_overlap = not (self.bottom_y + margin < other.y or other.bottom_y + margin < self.y)
-        
-        return horizontal_overlap and vertical_overlap
+        # Horizontal overlap, then vertical overlap (with optional margin);
+        # stops at the first separating edge
+        return (self.end_col >= other.col and other.end_col >= self.col
+                and self.bottom_y + margin >= other.y and other.bottom_y + margin >= self.y)
     
     def __str__(self) -> str:
         return f"GridRect(col={self.col}, span={self.span}, y={self.y}, h={self.row_h}, type={self.component_type})"
 
 
+class ColumnMaxTree:
+    """Segment tree over grid columns tracking the lowest bottom_y placed in each column.
+    Answers "lowest placed edge across columns [first, last]" in O(log C).
+    """
+    
+    def __init__(self, columns: int, initial: float = float('-inf')):
+        self.columns = columns
+        self.size = 1
+        while self.size < columns:
+            self.size *= 2
+        self.tree = [initial] * (2 * self.size)
+    
+    def update(self, first_col: int, last_col: int, value: float):
+        """Raise every column in [first_col, last_col] (1-based) to at least value."""
+        # Columns off the grid are not tracked
+        for col in range(max(first_col, 1), min(last_col, self.columns) + 1):
+            i = self.size + col - 1
+            if value <= self.tree[i]:
+                continue
+            self.tree[i] = value
+            i //= 2
+            while i and self.tree[i] < value:
+                self.tree[i] = value
+                i //= 2
+    
+    def range_max(self, first_col: int, last_col: int) -> float:
+        """Return the maximum value over columns [first_col, last_col] (1-based)."""
+        if first_col < 1 or last_col > self.columns:
+            # Range leaves the grid, where nothing is tracked: never report it as free
+            return float('inf')
+        result = float('-inf')
+        lo = self.size + first_col - 1
+        hi = self.size + last_col
+        while lo < hi:
+            if lo & 1:
+                result = max(result, self.tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                result = max(result, self.tree[hi])
+            lo //= 2
+            hi //= 2
+        return result
+    
+    def add_rect(self, rect: GridRect):
+        self.update(rect.col, rect.end_col, rect.bottom_y)
+
+
+def _first_free_col(tried_cols, span: int, top: float, bottom: float,
+                    placed_bounds: List[Tuple[int, int, float, float]], reaches: List[float],
+                    column_tree: ColumnMaxTree, gap: float) -> Optional[int]:
+    """Return the first column in tried_cols where a span-wide box from top to bottom
+    clears every placed rect by gap, or None if none does.
+    placed_bounds holds (col, end_col, y, bottom_y) per placed rect, sorted by bottom_y;
+    reaches holds the matching bottom_y + gap values.
+    """
+    # Rects whose bottom (plus gap) stays above top can never overlap; skip past them
+    start = bisect_left(reaches, top)
+    for col in tried_cols:
+        end = col + span - 1
+        # Nothing in these columns reaches down to top: no overlap possible
+        if column_tree.range_max(col, end) + gap < top:
+            return col
+        for i in range(start, len(placed_bounds)):
+            p_col, p_end, p_top, p_bottom = placed_bounds[i]
+            if end >= p_col and p_end >= col and bottom + gap >= p_top:
+                break
+        else:
+            return col
+    return None
+
+
+def _split_free_rects(free_rects: List[FreeRect], used: FreeRect) -> List[FreeRect]:
+    """MaxRects split: replace every free region intersecting used with the
+    (up to four) maximal strips of it that lie left, right, above and below used.
+    """
+    u_x1, u_x2, u_y1, u_y2 = used
+    result = []
+    for free in free_rects:
+        x1, x2, y1, y2 = free
+        if x1 >= u_x2 or u_x1 >= x2 or y1 >= u_y2 or u_y1 >= y2:
+            result.append(free)
+            continue
+        if x1 < u_x1:
+            result.append((x1, u_x1, y1, y2))
+        if u_x2 < x2:
+            result.append((u_x2, x2, y1, y2))
+        if y1 < u_y1:
+            result.append((x1, x2, y1, u_y1))
+        if u_y2 < y2:
+            result.append((x1, x2, u_y2, y2))
+    return result
+
+
+def _prune_free_rects(free_rects: List[FreeRect]) -> List[FreeRect]:
+    """Drop free regions contained in another one (keeping one of any duplicates)."""
+    unique = list(dict.fromkeys(free_rects))
+    return [
+        a for i, a in enumerate(unique)
+        if not any(i != j and b[0] <= a[0] and a[1] <= b[1] and b[2] <= a[2] and a[3] <= b[3]
+                   for j, b in enumerate(unique))
+    ]
+
+
 class GridAutoAligner:
     """Automatically adjusts grid positioning to prevent overlaps."""
     
@@ -51,56 +176,82 @@ class GridAutoAligner:
         self.margin = tokens["spacing"]["margin"]
         self.gutter = tokens["spacing"]["gutter"]
         self.min_gap = 8  # Minimum gap between components in pixels
+        self._tried_cols_cache: Dict[Tuple[int, int, bool], Tuple[int, ...]] = {}
+        # Strategy name -> bound method, resolved once per aligner
+        self._strategies = {
+            "preserve_order": self._align_preserve_order,
+            "compact": self._align_compact,
+            "balanced": self._align_balanced,
+            "maxrects": self._align_maxrects,
+        }
         
-    def _would_overlap(self, test: GridRect, placed_rects: List[GridRect]) -> bool:
-        """Return True if test rectangle overlaps any placed rectangle (with min_gap)."""
+    def _build_column_tree(self, placed_rects: List[GridRect]) -> ColumnMaxTree:
+        tree = ColumnMaxTree(self.grid_columns)
         for existing in placed_rects:
-            if test.overlaps_with(existing, self.min_gap):
-                return True
-        return False
+            tree.add_rect(existing)
+        return tree
+
+    def _tried_cols(self, rect: GridRect) -> Tuple[int, ...]:
+        """Columns place_rect may try for rect, in preference order (cached per shape)."""
+        locked = rect.component_type in LOCKED_TYPES
+        key = (rect.span, rect.col, locked)
+        tried_cols = self._tried_cols_cache.get(key)
+        if tried_cols is None:
+            # Determine which columns to try. For images/charts/tables, lock to original column.
+            if locked:
+                cols = [rect.col]
+            else:
+                cols = list(range(1, self.grid_columns - rect.span + 2))
+                # Prefer original column first
+                if rect.col in cols:
+                    cols.remove(rect.col)
+                    cols.insert(0, rect.col)
+            tried_cols = self._tried_cols_cache[key] = tuple(cols)
+        return tried_cols
 
-    def _max_overlap_bottom_y(self, test: GridRect, placed_rects: List[GridRect]) -> float:
-        """Return maximum bottom_y among placed rects that overlap horizontally with test.
-        If none overlap horizontally, returns test.y.
+    def _max_overlap_bottom_y(self, col: int, end_col: int, y: float,
+                              column_tree: ColumnMaxTree) -> float:
+        """Return the y just below the lowest placed rect overlapping columns col..end_col.
+        If none reach y, returns y.
         """
-        max_bottom = test.y
-        for existing in placed_rects:
-            # Horizontal overlap only; vertical will be resolved by pushing down
-            horiz_overlap = not (test.end_col < existing.col or existing.end_col < test.col)
-            if horiz_overlap:
-                if existing.bottom_y + self.min_gap > max_bottom:
-                    max_bottom = existing.bottom_y + self.gutter
-        return max_bottom
-
-    def place_rect(self, rect: GridRect, placed_rects: List[GridRect]) -> Tuple[int, float]:
+        # Horizontal overlap only; vertical will be resolved by pushing down.
+        # Only on-grid columns hold placed rects, so clip a span wider than the grid
+        lowest = column_tree.range_max(max(col, 1), min(end_col, column_tree.columns))
+        if lowest + self.min_gap > y:
+            return lowest + self.gutter
+        return y
+
+    def place_rect(self, rect: GridRect, placed_rects: List[GridRect],
+                   column_tree: Optional[ColumnMaxTree] = None) -> Tuple[int, float]:
         """Smart placement: try keep column and y, then try other columns, else push down and retry.
         Special rule: for images, NEVER move horizontally; only push down to avoid overlap.
+        Pass the caller's column_tree to avoid rebuilding it from placed_rects.
         Returns (col, y).
         """
+        if column_tree is None:
+            column_tree = self._build_column_tree(placed_rects)
+        if rect.span > self.grid_columns:
+            # Wider than the grid: no column fits, so pin to col 1 just below everything placed
+            return 1, max(rect.y, column_tree.range_max(1, self.grid_columns) + self.gutter)
         max_iters = 100
-        # Determine which columns to try. For images/charts/tables, lock to original column.
-        if rect.component_type in ("image", "chart", "table"):
-            tried_cols = [rect.col]
-        else:
-            tried_cols = list(range(1, self.grid_columns - rect.span + 2))
-            # Prefer original column first
-            if rect.col in tried_cols:
-                tried_cols.remove(rect.col)
-                tried_cols.insert(0, rect.col)
+        tried_cols = self._tried_cols(rect)
+
+        # Column whose span is used to decide how far to push down
+        preferred_col = rect.col if 1 <= rect.col <= self.grid_columns - rect.span + 1 else 1
 
+        placed_bounds = sorted(((r.col, r.end_col, r.y, r.bottom_y) for r in placed_rects),
+                               key=lambda b: b[3])
+        reaches = [b[3] + self.min_gap for b in placed_bounds]
         current_y = rect.y
         for _ in range(max_iters):
             # Try each column at current_y
-            for col in tried_cols:
-                test = GridRect(col=col, span=rect.span, y=current_y, row_h=rect.row_h,
-                                component_id=rect.component_id, component_type=rect.component_type)
-                if not self._would_overlap(test, placed_rects):
-                    return col, current_y
+            col = _first_free_col(tried_cols, rect.span, current_y, current_y + rect.row_h,
+                                  placed_bounds, reaches, column_tree, self.min_gap)
+            if col is not None:
+                return col, current_y
             # All columns at this y overlap; push down just below the lowest overlapping item in preferred column span
-            preferred_col = rect.col if 1 <= rect.col <= self.grid_columns - rect.span + 1 else 1
-            test_pref = GridRect(col=preferred_col, span=rect.span, y=current_y, row_h=rect.row_h,
-                                 component_id=rect.component_id, component_type=rect.component_type)
-            new_y = self._max_overlap_bottom_y(test_pref, placed_rects)
+            new_y = self._max_overlap_bottom_y(preferred_col, preferred_col + rect.span - 1,
+                                               current_y, column_tree)
             if new_y <= current_y:
                 # Fallback incremental push
                 new_y = current_y + self.gutter
@@ -111,96 +262,111 @@ class GridAutoAligner:
     def extract_grid_rects(self, components: List[Dict[str, Any]]) -> List[GridRect]:
         """Extract grid rectangles from components."""
         rects = []
+        append = rects.append
         
         for i, comp in enumerate(components):
             if "grid" not in comp:
                 continue
                 
             grid = comp["grid"]
-            rect = GridRect(
-                col=grid["col"],
-                span=grid["span"],
-                y=grid.get("y", 0),
-                row_h=grid["row_h"],
-                component_id=f"comp_{i}",
-                component_type=comp.get("type", "unknown")
-            )
-            rects.append(rect)
+            # Positional arguments: keyword passing was a measurable share of the cost
+            append(GridRect(grid["col"], grid["span"], grid.get("y", 0), grid["row_h"],
+                            f"comp_{i}", comp.get("type", "unknown")))
             
         return rects
     
     def detect_overlaps(self, rects: List[GridRect]) -> List[Tuple[GridRect, GridRect]]:
         """Detect overlapping rectangles."""
+        return [(rects[i], rects[j]) for i, j in self.detect_overlap_indices(rects)]
+    
+    def detect_overlap_indices(self, rects: List[GridRect]) -> List[Tuple[int, int]]:
+        """Detect overlapping rectangles as (i, j) index pairs into rects, i < j,
+        in input order. Cheaper than detect_overlaps when only counts or ids are needed.
+        Sweeps top to bottom keeping only rects whose bottom (plus gap) still
+        reaches the sweep line, so each rect is compared against its vertical
+        neighbours rather than every other rect.
+        """
+        gap = self.min_gap
+        # Below ~16 rects the flat pair loop beats the sort + heap setup; the sweep
+        # also relies on bottom_y >= y, so odd input takes the exhaustive scan
+        if len(rects) < PAIRWISE_OVERLAP_MAX or gap < 0 or any(r.row_h < 0 for r in rects):
+            return self._overlap_indices_pairwise(rects)
+        
+        order = sorted(range(len(rects)), key=lambda i: rects[i].y)
+        active: List[Tuple[float, int]] = []  # (bottom_y + gap, index) heap
+        pairs = []
+        
+        for j in order:
+            rect_j = rects[j]
+            top_j = rect_j.y
+            # Drop rects that end (with gap) above this one's top
+            while active and active[0][0] < top_j:
+                heappop(active)
+            col_j, end_j = rect_j.col, rect_j.end_col
+            for _, i in active:
+                rect_i = rects[i]
+                if rect_i.end_col >= col_j and end_j >= rect_i.col:
+                    pairs.append((i, j) if i < j else (j, i))
+            heappush(active, (rect_j.bottom_y + gap, j))
+        
+        pairs.sort()
+        return pairs
+    
+    def _overlap_indices_pairwise(self, rects: List[GridRect]) -> List[Tuple[int, int]]:
+        """Compare every pair of rectangles."""
         overlaps = []
+        gap = self.min_gap
         
-        for i in range(len(rects)):
-            for j in range(i + 1, len(rects)):
-                if rects[i].overlaps_with(rects[j], self.min_gap):
-                    overlaps.append((rects[i], rects[j]))
+        # Pull the edges out once so the pair loop compares plain numbers
+        # instead of calling overlaps_with and its properties per pair
+        bounds = [(r.col, r.end_col, r.y, r.bottom_y + gap) for r in rects]
+        
+        for i, (col_i, end_i, y_i, bottom_i) in enumerate(bounds):
+            for j in range(i + 1, len(bounds)):
+                col_j, end_j, y_j, bottom_j = bounds[j]
+                if end_i >= col_j and end_j >= col_i and bottom_i >= y_j and bottom_j >= y_i:
+                    overlaps.append((i, j))
                     
         return overlaps
     
     def find_available_position(self, rect: GridRect, existing_rects: List[GridRect], 
-                              preferred_col: Optional[int] = None) -> Tuple[int, float]:
-        """Find an available position for a rectangle."""
+                              preferred_col: Optional[int] = None,
+                              column_tree: Optional[ColumnMaxTree] = None) -> Tuple[int, float]:
+        """Find an available position for a rectangle.
+        Pass the caller's column_tree to avoid rebuilding it from existing_rects.
+        """
+        if column_tree is None:
+            column_tree = self._build_column_tree(existing_rects)
+        placed_bounds = sorted(((r.col, r.end_col, r.y, r.bottom_y) for r in existing_rects),
+                               key=lambda b: b[3])
+        reaches = [b[3] + self.min_gap for b in placed_bounds]
+        
+        def first_free(cols, y):
+            return _first_free_col(cols, rect.span, y, y + rect.row_h,
+                                   placed_bounds, reaches, column_tree, self.min_gap)
+        
+        columns = range(1, self.grid_columns - rect.span + 2)
+        
         # Try preferred column first
         if preferred_col and 1 <= preferred_col <= self.grid_columns - rect.span + 1:
-            test_rect = GridRect(
-                col=preferred_col,
-                span=rect.span,
-                y=rect.y,
-                row_h=rect.row_h,
-                component_id=rect.component_id,
-                component_type=rect.component_type
-            )
-            
-            if not any(test_rect.overlaps_with(existing, self.min_gap) for existing in existing_rects):
+            if first_free((preferred_col,), rect.y) is not None:
                 return preferred_col, rect.y
         
-        # Try different columns
-        for col in range(1, self.grid_columns - rect.span + 2):
-            test_rect = GridRect(
-                col=col,
-                span=rect.span,
-                y=rect.y,
-                row_h=rect.row_h,
-                component_id=rect.component_id,
-                component_type=rect.component_type
-            )
-            
-            if not any(test_rect.overlaps_with(existing, self.min_gap) for existing in existing_rects):
-                return col, rect.y
+        # Try different columns, leftmost first
+        col = first_free(columns, rect.y)
+        if col is not None:
+            return col, rect.y
         
         # If no horizontal space, try moving down
-        max_bottom = max((r.bottom_y for r in existing_rects), default=0)
+        max_bottom = placed_bounds[-1][3] if placed_bounds else 0
         new_y = max_bottom + self.gutter
         
-        # Try original column with new Y
-        test_rect = GridRect(
-            col=rect.col,
-            span=rect.span,
-            y=new_y,
-            row_h=rect.row_h,
-            component_id=rect.component_id,
-            component_type=rect.component_type
-        )
-        
-        if not any(test_rect.overlaps_with(existing, self.min_gap) for existing in existing_rects):
-            return rect.col, new_y
-        
-        # Try other columns with new Y
-        for col in range(1, self.grid_columns - rect.span + 2):
-            test_rect = GridRect(
-                col=col,
-                span=rect.span,
-                y=new_y,
-                row_h=rect.row_h,
-                component_id=rect.component_id,
-                component_type=rect.component_type
-            )
-            
-            if not any(test_rect.overlaps_with(existing, self.min_gap) for existing in existing_rects):
-                return col, new_y
+        # Try original column with new Y, then other columns with new Y
+        col = first_free((rect.col,), new_y)
+        if col is None:
+            col = first_free(columns, new_y)
+        if col is not None:
+            return col, new_y
         
         # Fallback: return original position
         return rect.col, rect.y
@@ -215,32 +381,64 @@ class GridAutoAligner:
         - "compact": Try to minimize total height
         - "balanced": Balance components across columns
         """
+        return self.align_with_stats(components, strategy)[0]
+    
+    def align_with_stats(self, components: List[Dict[str, Any]],
+                         strategy: str = "preserve_order") -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Auto-align components and return (components, stats).
+        
+        Stats are built from the rects the strategy just placed, so callers
+        don't need a separate validate_alignment() pass.
+        """
+        strategy_fn = self._strategies.get(strategy)
+        if strategy_fn is None:
+            raise ValueError(f"Unknown strategy: {strategy}")
+        
         if not components:
-            return components
+            return components, self._placement_stats([])
             
         # Extract grid rectangles
         rects = self.extract_grid_rects(components)
         if not rects:
-            return components
-            
-        # Create a copy of components to modify
-        aligned_components = deepcopy(components)
+            return components, self._placement_stats([])
         
-        if strategy == "preserve_order":
-            return self._align_preserve_order(aligned_components, rects)
-        elif strategy == "compact":
-            return self._align_compact(aligned_components, rects)
-        elif strategy == "balanced":
-            return self._align_balanced(aligned_components, rects)
-        else:
-            raise ValueError(f"Unknown strategy: {strategy}")
+        # Copy only what gets modified: the component dict and its grid.
+        # Everything else (text, runs, styles) is shared with the input.
+        aligned_components = [
+            {**comp, "grid": {**comp["grid"]}} if "grid" in comp else comp
+            for comp in components
+        ]
+        
+        # Fast path: place_rect would leave one or two non-overlapping rects where they are
+        if strategy == "preserve_order" and self._is_settled(components, rects):
+            return aligned_components, self._placement_stats(rects)
+        
+        aligned_components, placed_rects = strategy_fn(aligned_components, rects)
+        
+        return aligned_components, self._placement_stats(placed_rects)
+    
+    def _is_settled(self, components: List[Dict[str, Any]], rects: List[GridRect]) -> bool:
+        """True if preserve_order alignment would not move any of (at most two) rects."""
+        if len(rects) > 2:
+            return False
+        # Missing y gets written back as 0, and out-of-range columns get moved
+        # (a rect wider than the grid has no columns to try and takes the normal path)
+        for rect in rects:
+            tried_cols = self._tried_cols(rect)
+            if not tried_cols or tried_cols[0] != rect.col:
+                return False
+        if not all("y" in comp["grid"] for comp in components if "grid" in comp):
+            return False
+        return len(rects) == 1 or not rects[0].overlaps_with(rects[1], self.min_gap)
     
     def _align_preserve_order(self, components: List[Dict[str, Any]], 
-                            rects: List[GridRect]) -> List[Dict[str, Any]]:
+                            rects: List[GridRect]) -> Tuple[List[Dict[str, Any]], List[GridRect]]:
         """Align components preserving their original order."""
         # Sort by original y to respect top-down flow; stable to preserve order among equals
         order = sorted(range(len(rects)), key=lambda i: rects[i].y)
         placed_rects: List[GridRect] = []
+        column_tree = ColumnMaxTree(self.grid_columns)
         
         for idx in order:
             comp = components[idx]
@@ -249,30 +447,26 @@ class GridAutoAligner:
                 continue
 
             # Smart placement: try best fit then push down iteratively
-            new_col, new_y = self.place_rect(rect, placed_rects)
+            new_col, new_y = self.place_rect(rect, placed_rects, column_tree)
 
             # Update component
             comp["grid"]["col"] = new_col
             comp["grid"]["y"] = new_y
 
-            # Track placement
-            placed_rects.append(GridRect(
-                col=new_col,
-                span=rect.span,
-                y=new_y,
-                row_h=rect.row_h,
-                component_id=rect.component_id,
-                component_type=rect.component_type
-            ))
+            # Track placement (rects are ours, from extract_grid_rects, so move in place)
+            rect.move_to(new_col, new_y)
+            placed_rects.append(rect)
+            column_tree.add_rect(rect)
             
-        return components
+        return components, placed_rects
     
     def _align_compact(self, components: List[Dict[str, Any]], 
-                      rects: List[GridRect]) -> List[Dict[str, Any]]:
+                      rects: List[GridRect]) -> Tuple[List[Dict[str, Any]], List[GridRect]]:
         """Align components to minimize total height."""
         # Sort by height (tallest first) to place them optimally
         sorted_indices = sorted(range(len(rects)), key=lambda i: rects[i].row_h, reverse=True)
         placed_rects = []
+        column_tree = ColumnMaxTree(self.grid_columns)
         
         for idx in sorted_indices:
             comp = components[idx]
@@ -282,30 +476,24 @@ class GridAutoAligner:
                 continue
                 
             # Find best position (prefer leftmost available)
-            best_col, best_y = self.find_available_position(rect, placed_rects)
+            best_col, best_y = self.find_available_position(rect, placed_rects, column_tree=column_tree)
             
             # Update component
             comp["grid"]["col"] = best_col
             comp["grid"]["y"] = best_y
             
-            # Create new rect for tracking
-            new_rect = GridRect(
-                col=best_col,
-                span=rect.span,
-                y=best_y,
-                row_h=rect.row_h,
-                component_id=rect.component_id,
-                component_type=rect.component_type
-            )
-            placed_rects.append(new_rect)
+            # Track placement
+            rect.move_to(best_col, best_y)
+            placed_rects.append(rect)
+            column_tree.add_rect(rect)
             
-        return components
+        return components, placed_rects
     
     def _align_balanced(self, components: List[Dict[str, Any]], 
-                       rects: List[GridRect]) -> List[Dict[str, Any]]:
+                       rects: List[GridRect]) -> Tuple[List[Dict[str, Any]], List[GridRect]]:
         """Balance components across columns."""
         # Track column heights
-        column_heights = [0.0] * self.grid_columns
+        column_heights = ColumnMaxTree(self.grid_columns, initial=0.0)
         placed_rects = []
         
         for i, (comp, rect) in enumerate(zip(components, rects)):
@@ -318,53 +506,132 @@ class GridAutoAligner:
             
             for col in range(1, self.grid_columns - rect.span + 2):
                 # Check if this column range is available
-                max_height_in_range = max(column_heights[col-1:col-1+rect.span])
+                max_height_in_range = column_heights.range_max(col, col + rect.span - 1)
                 
                 if max_height_in_range < min_height:
                     min_height = max_height_in_range
                     best_col = col
+            if rect.span > self.grid_columns:
+                # Wider than the grid: no column range fits, so go below every column
+                min_height = column_heights.range_max(1, self.grid_columns)
             
             # Place component
             new_y = min_height + self.gutter
             comp["grid"]["col"] = best_col
             comp["grid"]["y"] = new_y
             
-            # Update column heights
-            for col in range(best_col, best_col + rect.span):
-                column_heights[col-1] = new_y + rect.row_h
+            # Update column heights (new_y is below everything in the range, so this only raises them)
+            column_heights.update(best_col, best_col + rect.span - 1, new_y + rect.row_h)
+            
+            # Track placement
+            rect.move_to(best_col, new_y)
+            placed_rects.append(rect)
+            
+        return components, placed_rects
+    
+    def _align_maxrects(self, components: List[Dict[str, Any]],
+                        rects: List[GridRect]) -> Tuple[List[Dict[str, Any]], List[GridRect]]:
+        """Pack components with MaxRects (best short side fit), largest area first.
+        Keeps a list of maximal free regions over the columns with unbounded height;
+        each component takes the top-left corner of the region it fits most snugly,
+        with the gutter reserved below it. Images, charts and tables keep their column.
+        """
+        columns = self.grid_columns
+        pad = self.gutter
+        # Width of one column step in px, so leftover columns and px compare fairly
+        column_px = (REFERENCE_SLIDE_WIDTH - 2 * self.margin + self.gutter) / columns
+        free_rects: List[FreeRect] = [(1, columns + 1, 0, float('inf'))]
+        order = sorted(range(len(rects)), key=lambda i: rects[i].span * rects[i].row_h, reverse=True)
+        placed_rects = []
+        
+        for idx in order:
+            comp = components[idx]
+            rect = rects[idx]
+            if "grid" not in comp:
+                continue
+            
+            span, need_h = rect.span, rect.row_h + pad
+            locked = rect.component_type in LOCKED_TYPES
+            best = None
+            for x1, x2, y1, y2 in free_rects:
+                if locked:
+                    if not (x1 <= rect.col and rect.col + span <= x2):
+                        continue
+                    col = rect.col
+                elif span <= x2 - x1:
+                    col = x1
+                else:
+                    continue
+                if need_h > y2 - y1:
+                    continue
+                leftover_w = (x2 - x1 - span) * column_px
+                leftover_h = y2 - y1 - need_h
+                score = (min(leftover_w, leftover_h), max(leftover_w, leftover_h), y1, col)
+                if best is None or score < best:
+                    best = score
             
-            # Create new rect for tracking
-            new_rect = GridRect(
-                col=best_col,
-                span=rect.span,
-                y=new_y,
-                row_h=rect.row_h,
-                component_id=rect.component_id,
-                component_type=rect.component_type
-            )
-            placed_rects.append(new_rect)
+            if best is not None:
+                new_col, new_y = best[3], best[2]
+            else:
+                # Wider than the grid (or locked off-grid): park it below everything
+                tried_cols = self._tried_cols(rect)
+                new_col = tried_cols[0] if tried_cols and not locked else rect.col
+                new_y = max((r.bottom_y + pad for r in placed_rects), default=0)
+            
+            comp["grid"]["col"] = new_col
+            comp["grid"]["y"] = new_y
+            rect.move_to(new_col, new_y)
+            placed_rects.append(rect)
             
-        return components
+            free_rects = _prune_free_rects(_split_free_rects(
+                free_rects, (new_col, new_col + span, new_y, new_y + need_h)))
+        
+        return components, placed_rects
+    
+    def auto_align_slide(self, slide_data: Dict[str, Any],
+                         strategy: str = "preserve_order") -> Dict[str, Any]:
+        """Auto-align the components of one slide; returns the updated slide data."""
+        if "components" not in slide_data:
+            return slide_data
+        
+        # Stats come from the placement itself; no second extract/overlap pass
+        aligned_components, stats = self.align_with_stats(
+            slide_data["components"], 
+            strategy
+        )
+        logger.debug("Aligned %d components (%s): total height %s, column usage %s",
+                     stats["components_count"], strategy, stats["total_height"], stats["column_usage"])
+        
+        # Create updated slide data (don't add validation metadata to avoid schema issues).
+        # Only "components" changes, so the other slide keys are shared with the input
+        return {**slide_data, "components": aligned_components}
     
     def validate_alignment(self, components: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Validate the final alignment and return statistics."""
         rects = self.extract_grid_rects(components)
-        overlaps = self.detect_overlaps(rects)
+        overlaps = self.detect_overlap_indices(rects)
         
+        return {
+            "overlaps_detected": len(overlaps),
+            "overlapping_pairs": [(rects[i].component_id, rects[j].component_id) for i, j in overlaps],
+            **self._placement_stats(rects),
+            "is_valid": len(overlaps) == 0
+        }
+    
+    def _placement_stats(self, rects: List[GridRect]) -> Dict[str, Any]:
+        """Height and column usage of already-positioned rects (no overlap check)."""
         total_height = max((r.bottom_y for r in rects), default=0)
         column_usage = [0] * self.grid_columns
         
         for rect in rects:
-            for col in range(rect.col, rect.col + rect.span):
+            # Only count the part of the span that lies on the grid
+            for col in range(max(rect.col, 1), min(rect.end_col, self.grid_columns) + 1):
                 column_usage[col-1] += 1
         
         return {
-            "overlaps_detected": len(overlaps),
-            "overlapping_pairs": [(r1.component_id, r2.component_id) for r1, r2 in overlaps],
             "total_height": total_height,
             "column_usage": column_usage,
             "components_count": len(rects),
-            "is_valid": len(overlaps) == 0
         }
 
 
@@ -376,29 +643,12 @@ def auto_align_slide_components(slide_data: Dict[str, Any], tokens: Dict[str, An
     Args:
         slide_data: Slide data with components
         tokens: Design tokens with grid configuration
-        strategy: Alignment strategy ("preserve_order", "compact", "balanced")
+        strategy: Alignment strategy ("preserve_order", "compact", "balanced", "maxrects")
     
     Returns:
         Updated slide data with aligned components
     """
-    aligner = GridAutoAligner(tokens)
-    
-    if "components" not in slide_data:
-        return slide_data
-    
-    aligned_components = aligner.auto_align_components(
-        slide_data["components"], 
-        strategy
-    )
-    
-    # Validate the result
-    validation = aligner.validate_alignment(aligned_components)
-    
-    # Create updated slide data (don't add validation metadata to avoid schema issues)
-    updated_slide = deepcopy(slide_data)
-    updated_slide["components"] = aligned_components
-    
-    return updated_slide
+    return GridAutoAligner(tokens).auto_align_slide(slide_data, strategy)
 
 
 def auto_align_presentation(presentation_data: Dict[str, Any], 
@@ -408,7 +658,7 @@ def auto_align_presentation(presentation_data: Dict[str, Any],
     
     Args:
         presentation_data: Full presentation JSON data
-        strategy: Alignment strategy ("preserve_order", "compact", "balanced")
+        strategy: Alignment strategy ("preserve_order", "compact", "balanced", "maxrects")
     
     Returns:
         Updated presentation data with aligned components
@@ -416,18 +666,16 @@ def auto_align_presentation(presentation_data: Dict[str, Any],
     if "slides" not in presentation_data or "tokens" not in presentation_data:
         raise ValueError("Presentation data must contain 'slides' and 'tokens'")
     
-    tokens = presentation_data["tokens"]
+    # Tokens are shared by every slide, so one aligner (and its caches) serves them all
+    aligner = GridAutoAligner(presentation_data["tokens"])
     updated_slides = []
     
     for slide in presentation_data["slides"]:
-        aligned_slide = auto_align_slide_components(slide, tokens, strategy)
+        aligned_slide = aligner.auto_align_slide(slide, strategy)
         updated_slides.append(aligned_slide)
     
-    # Create updated presentation
-    updated_presentation = deepcopy(presentation_data)
-    updated_presentation["slides"] = updated_slides
-    
-    return updated_presentation
+    # Create updated presentation; only "slides" changes, so a shallow copy is enough
+    return {**presentation_data, "slides": updated_slides}
 
 
 # Example usage and testing
@@ -473,8 +721,9 @@ if __name__ == "__main__":
     print("\nAligned data:")
     print(json.dumps(aligned_data["slides"][0]["components"], indent=2))
     
-    # Show validation results
-    validation = aligned_data["slides"][0]["_alignment_validation"]
+    # Show validation results (not stored on the slide, to keep it schema-clean)
+    aligner = GridAutoAligner(example_data["tokens"])
+    validation = aligner.validate_alignment(aligned_data["slides"][0]["components"])
     print(f"\nValidation:")
     print(f"Overlaps detected: {validation['overlaps_detected']}")
     print(f"Total height: {validation['total_height']}")
@@ -4,7 +4,6 @@ Inspect XML directly to get the exact color value
 """
 
 from pptx import Presentation
-import xml.etree.ElementTree as ET
 
 def inspect_xml_color(pptx_path, slide_num):
     """Inspect XML for color information"""
@@ -17,31 +16,28 @@ def inspect_xml_color(pptx_path, slide_num):
             print("Found shape with '1'")
             print(f"Shape type: {shape.shape_type}")
             
-            # Get the XML
-            xml = shape._element.xml
-            
-            # Parse and pretty print relevant parts
-            root = ET.fromstring(xml)
+            # Query the shape's lxml element directly instead of serializing and reparsing it;
+            # python-pptx's xpath() already maps the "a:" (DrawingML) prefix
+            element = shape._element
             
             # Look for color elements
             print("\nSearching for color elements in XML...")
             
             # Find all solidFill elements
-            for elem in root.iter():
-                if 'solidFill' in elem.tag:
-                    print(f"\nFound solidFill: {elem.tag}")
-                    for child in elem:
-                        print(f"  Child: {child.tag}, attribs: {child.attrib}")
-                        if 'schemeClr' in child.tag:
-                            print(f"    Scheme Color: {child.get('val')}")
-                        elif 'srgbClr' in child.tag:
-                            print(f"    RGB Color: {child.get('val')}")
-                
-                if 'schemeClr' in elem.tag:
-                    print(f"\nFound schemeClr directly: val={elem.get('val')}")
-                
-                if 'srgbClr' in elem.tag:
-                    print(f"\nFound srgbClr directly: val={elem.get('val')}")
+            for fill in element.xpath('.//a:solidFill'):
+                print(f"\nFound solidFill: {fill.tag}")
+                for child in fill:
+                    print(f"  Child: {child.tag}, attribs: {dict(child.attrib)}")
+            
+            for val in element.xpath('.//a:solidFill/a:schemeClr/@val'):
+                print(f"    Scheme Color: {val}")
+            for val in element.xpath('.//a:solidFill/a:srgbClr/@val'):
+                print(f"    RGB Color: {val}")
+            
+            for val in element.xpath('.//a:schemeClr/@val'):
+                print(f"\nFound schemeClr directly: val={val}")
+            for val in element.xpath('.//a:srgbClr/@val'):
+                print(f"\nFound srgbClr directly: val={val}")
             
             break
 
@@ -1,219 +1,60 @@
 import json
+from functools import lru_cache
+from pathlib import Path
+from xml.sax.saxutils import escape
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
-data={
-  "deck": {
-    "title": "Q3 Business Review – AI & Compliance",
-    "author": "Mobifly",
-    "company": "PwC (Example)",
-    "confidentiality": "Confidential",
-    "date": "2025-09-18",
-    "locale": "en-US",
-    "rtl": False,
-    "slide_size": "16x9",
-    "slide_numbering": True,
-    "header": "PwC | Mobifly – AI Automation",
-    "footer_left": "© 2025 Mobifly",
-    "footer_right": "Confidential",
-    "watermark": { "text": "CONFIDENTIAL", "opacity": 0.08, "angle": -30 },
-    "security": { "allow_remote_assets": False, "max_image_bytes": 5242880 }
-  },
-
-  "tokens": {
-    "color": {
-      "bg": "#0F172A",
-      "surface": "#111827",
-      "primary": "#2563EB",
-      "accent": "#10B981",
-      "danger": "#EF4444",
-      "text": "#E5E7EB",
-      "muted": "#9CA3AF",
-      "tableHeader": "#1F2937",
-      "zebra": "#0B1220",
-      "border": "#374151"
-    },
-    "font": {
-      "title_family": "Calibri",
-      "body_family": "Calibri",
-      "code_family": "Consolas",
-      "fallbacks": ["Arial", "Noto Sans"],
-      "title_size": 44,
-      "h2_size": 28,
-      "body_size": 18,
-      "min_body_size": 14,
-      "line_spacing": 1.2
-    },
-    "spacing": { "margin": 24, "gutter": 12 },
-    "grid": { "columns": 12, "unit": "px" }
-  },
-
-  "defaults": {
-    "title_style": { "bold": True, "color": "text", "align": "left" },
-    "body_style": { "color": "text", "align": "left" },
-    "table_style": {
-      "header_fill": "#1F2937",
-      "header_color": "#E5E7EB",
-      "row_zebra": "#0B1220",
-      "border_color": "#374151"
-    },
-    "chart_style": {
-      "palette": ["#2563EB", "#10B981", "#F59E0B", "#EF4444"],
-      "data_labels": True,
-      "legend": "right"
-    }
-  },
-
-  "slides": [
-    {
-      "title": "Cover",
-      "background": { "type": "solid", "color": "bg" },
-      "components": [
-        {
-          "type": "text",
-          "text_type": "title",
-          "value": "Q3 Business Review",
-          "grid": { "col": 1, "span": 12, "row_h": 120, "y": 120 },
-          "style": { "align": "left" },
-          "alt": "Deck title"
-        },
-        {
-          "type": "text",
-          "text_type": "body",
-          "value": "AI & Compliance Highlights",
-          "grid": { "col": 1, "span": 12, "row_h": 60, "y": 220 },
-          "style": { "font_size": 22, "color": "#9CA3AF" }
-        },
-        {
-          "type": "image",
-          "src": "assets/pwc_lockup.png",
-          "grid": { "col": 1, "span": 4, "row_h": 80, "y": 24 },
-          "object_fit": "contain",
-          "alt": "PwC logo"
-        }
-      ],
-      "notes": "Tailor talking points to client industry; call out measurable outcomes."
-    },
-
-    {
-      "title": "Executive Summary",
-      "background": { "type": "solid", "color": "bg" },
-      "components": [
-        {
-          "type": "text",
-          "text_type": "h2",
-          "value": "Key Outcomes",
-          "grid": { "col": 1, "span": 12, "row_h": 60, "y": 24 }
-        },
-        {
-          "type": "richtext",
-          "runs": [
-            {"text": "• 12% QoQ revenue growth; ", "bold": True},
-            {"text": "AI-driven invoice validation reduced exceptions by 37%.\n"},
-            {"text": "• 7 new logos in BFSI & GCC; ", "bold": True},
-            {"text": "pipeline strengthened in KSA.\n"},
-            {"text": "• Compliance latency cut from 3 days to ", "bold": False},
-            {"text": "6 hours", "bold": True},
-            {"text": ".", "bold": False}
-          ],
-          "grid": { "col": 1, "span": 12, "row_h": 200, "y": 84 },
-          "fit": "wrap",
-          "style": { "font_size": 20 }
-        }
-      ]
-    },
-
-    {
-      "title": "Key Metrics",
-      "background": { "type": "solid", "color": "bg" },
-      "components": [
-        {
-          "type": "text",
-          "text_type": "h2",
-          "value": "KPIs",
-          "grid": { "col": 1, "span": 6, "row_h": 48, "y": 24 }
-        },
-        {
-          "type": "table",
-          "grid": { "col": 1, "span": 6, "row_h": 320, "y": 80 },
-          "fit": "paginate",
-          "content": {
-            "columns": ["Metric", "Q3", "QoQ"],
-            "rows": [
-              ["Revenue", "$2.4M", "+12%"],
-              ["New Logos", "7", "+2"],
-              ["Churn", "1.2%", "-0.3 pp"],
-              ["Invoices Auto-cleared", "78%", "+11 pp"],
-              ["Avg Ticket Cycle Time", "6h", "-18h"]
-            ]
-          },
-          "table_options": {
-            "column_widths": [240, 140, 120],
-            "header_row": True,
-            "first_col_bold": True
-          },
-          "alt": "Table of key performance indicators"
-        },
-        {
-          "type": "chart",
-          "grid": { "col": 7, "span": 6, "row_h": 360, "y": 80 },
-          "fit": "wrap",
-          "content": {
-            "categories": ["India", "UAE", "KSA"],
-            "series": [
-              {"name": "Leads", "values": [42, 18, 11]},
-              {"name": "Qualified", "values": [21, 9, 5]}
-            ]
-          },
-          "chart_options": { "chartType": "column", "legend": "right", "data_labels": True },
-          "alt": "Column chart of leads and qualified by region"
-        }
-      ]
-    },
-
-    {
-      "title": "Architecture Snapshot",
-      "background": { "type": "solid", "color": "bg" },
-      "components": [
-        {
-          "type": "text",
-          "text_type": "h2",
-          "value": "Invoice Validation Platform (High Level)",
-          "grid": { "col": 1, "span": 12, "row_h": 60, "y": 24 }
-        },
-        {
-          "type": "image",
-          "src": "assets/arch-diagram.png",
-          "grid": { "col": 1, "span": 12, "row_h": 420, "y": 84 },
-          "object_fit": "contain",
-          "alt": "High-level architecture diagram"
-        }
-      ],
-      "notes": "Ensure client-approved diagram; avoid exposing internal hostnames."
-    },
-
-    {
-      "title": "Appendix: Sample Code",
-      "background": { "type": "solid", "color": "bg" },
-      "components": [
-        {
-          "type": "text",
-          "text_type": "h2",
-          "value": "Policy Check (Python)",
-          "grid": { "col": 1, "span": 12, "row_h": 48, "y": 24 }
-        },
-        {
-          "type": "code",
-          "value": "def check_threshold(invoice):\n    return invoice.amount <= 500000 and invoice.pan_verified\n",
-          "code_options": { "language": "python", "render_as": "image" },
-          "grid": { "col": 1, "span": 12, "row_h": 300, "y": 84 },
-          "alt": "Sample Python code block rendering as image"
-        }
-      ]
-    }
-  ]
-}
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.parts.slide import SlidePart
+
+@lru_cache(maxsize=64)
+def _rgb(hex_color: str) -> RGBColor:
+    """Parse a "#RRGGBB" string; repeated colors come from the cache."""
+    return RGBColor.from_string(hex_color.strip("#"))
+
+def _cell_txbody(text, color=None):
+    """Build a table cell's <a:txBody> in one parse (one paragraph per line),
+    instead of going through python-pptx's cell.text / font setters."""
+    ppr = (f'<a:pPr><a:defRPr><a:solidFill><a:srgbClr val="{color}"/></a:solidFill></a:defRPr></a:pPr>'
+           if color else "")
+    paras = "".join(
+        f'<a:p>{ppr}<a:r><a:t>{escape(line)}</a:t></a:r></a:p>' if line else f'<a:p>{ppr}</a:p>'
+        for line in text.split("\n")
+    )
+    return parse_xml(f'<a:txBody {nsdecls("a")}><a:bodyPr/><a:lstStyle/>{paras}</a:txBody>')
+
+def _textbox_sp(shape_id, x, y, w, h, text, size_pt=None, color=None):
+    """Build a word-wrapped single-run text box <p:sp> in one parse.
+    Same XML python-pptx's add_textbox + add_run + font setters produce."""
+    sz = f' sz="{int(size_pt * 100)}"' if size_pt is not None else ""
+    fill = f'<a:solidFill><a:srgbClr val="{color}"/></a:solidFill>' if color else ""
+    rpr = f'<a:rPr{sz}>{fill}</a:rPr>' if sz or fill else ""
+    return parse_xml(
+        f'<p:sp {nsdecls("a", "p")}>'
+        f'<p:nvSpPr><p:cNvPr id="{shape_id}" name="TextBox {shape_id - 1}"/>'
+        f'<p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+        f'<p:spPr><a:xfrm><a:off x="{int(x)}" y="{int(y)}"/><a:ext cx="{int(w)}" cy="{int(h)}"/></a:xfrm>'
+        f'<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+        f'<p:txBody><a:bodyPr wrap="square"><a:spAutoFit/></a:bodyPr><a:lstStyle/>'
+        f'<a:p><a:r>{rpr}<a:t>{escape(text)}</a:t></a:r></a:p></p:txBody>'
+        f'</p:sp>'
+    )
+
+def _append_slide(prs, slide_layout, slide_id):
+    """prs.slides.add_slide() minus its per-call scans of every existing slide
+    relationship and sldId (O(N) each, so O(N^2) over a deck). The new part can't
+    already be related, so the rel is added directly; the caller tracks slide_id."""
+    pres_part = prs.part
+    slide_part = SlidePart.new(pres_part._next_slide_partname, pres_part.package, slide_layout.part)
+    rId = pres_part.rels._add_relationship(RT.SLIDE, slide_part)
+    slide = slide_part.slide
+    slide.shapes.clone_layout_placeholders(slide_layout)
+    prs.slides._sldIdLst._add_sldId(id=slide_id, rId=rId)
+    return slide
 
 def create_ppt_from_json(data: dict, output_file="output.pptx"):
     # Initialize presentation
@@ -225,78 +66,97 @@ def create_ppt_from_json(data: dict, output_file="output.pptx"):
     margin = data["tokens"]["spacing"]["margin"]
     gutter = data["tokens"]["spacing"]["gutter"]
 
-    col_width = (prs.slide_width - 2 * Inches(margin/72)) / cols  # px → pt → inch
+    margin_emu = Inches(margin/72)  # px → pt → inch
+    col_width = (prs.slide_width - 2 * margin_emu) / cols
+    emu_per_px = 12700  # 1px is treated as 1pt
 
     def grid_to_position(grid):
-        """Convert grid spec to pptx position + size"""
-        x = Inches(margin/72) + col_width * (grid["col"] - 1)
+        """Convert grid spec to pptx position + size (plain EMU numbers, no Length objects)"""
+        x = margin_emu + col_width * (grid["col"] - 1)
         w = col_width * grid["span"]
-        y = Inches(grid["y"]/72)
-        h = Inches(grid["row_h"]/72)
+        y = int(grid["y"] * emu_per_px)
+        h = int(grid["row_h"] * emu_per_px)
         return x, y, w, h
 
+    # Resolve colors once instead of per slide/run/cell
+    palette = {name: _rgb(value) for name, value in data["tokens"]["color"].items()}
+    default_bg_rgb = _rgb("#FFFFFF")
+    default_text_rgb = _rgb("#E5E7EB")
+    table_style = data["defaults"]["table_style"]
+    header_text_hex = str(_rgb(table_style["header_color"]))
+    header_fill_xml = f'<a:solidFill {nsdecls("a")}><a:srgbClr val="{_rgb(table_style["header_fill"])}"/></a:solidFill>'
+
+    blank_layout = prs.slide_layouts[6]  # blank
+    next_slide_id = prs.slides._sldIdLst._next_id
+
     # Loop over slides
     for slide_json in data["slides"]:
-        slide_layout = prs.slide_layouts[6]  # blank
-        slide = prs.slides.add_slide(slide_layout)
+        slide = _append_slide(prs, blank_layout, next_slide_id)
+        next_slide_id += 1
+        shapes = slide.shapes
+        sp_tree = shapes._spTree
+        next_shape_id = shapes._next_shape_id
 
         # Background
-        bg_color = data["tokens"]["color"].get(slide_json["background"]["color"], "#FFFFFF")
         fill = slide.background.fill
         fill.solid()
-        fill.fore_color.rgb = RGBColor.from_string(bg_color.strip("#"))
+        fill.fore_color.rgb = palette.get(slide_json["background"]["color"], default_bg_rgb)
 
         # Components
         for comp in slide_json["components"]:
             x, y, w, h = grid_to_position(comp["grid"])
-
-            if comp["type"] == "text":
-                box = slide.shapes.add_textbox(x, y, w, h)
-                tf = box.text_frame
-                p = tf.paragraphs[0]
-                run = p.add_run()
-                run.text = comp["value"]
-                if "style" in comp:
-                    style = comp["style"]
-                    if "font_size" in style:
-                        run.font.size = Pt(style["font_size"])
-                    if "color" in style:
-                        run.font.color.rgb = RGBColor.from_string(
-                            style["color"].strip("#") if style["color"].startswith("#")
-                            else data["tokens"]["color"].get(style["color"], "#E5E7EB").strip("#")
-                        )
-                tf.word_wrap = True
-
-            elif comp["type"] == "image":
+            comp_type = comp["type"]
+
+            if comp_type == "text":
+                # Build the whole text box as XML rather than through the shape/run proxies
+                style = comp.get("style", {})
+                color = style.get("color")
+                if color is not None:
+                    color = _rgb(color) if color.startswith("#") else palette.get(color, default_text_rgb)
+                sp_tree.insert_element_before(
+                    _textbox_sp(next_shape_id, x, y, w, h, comp["value"],
+                                style.get("font_size"), color),
+                    "p:extLst"
+                )
+                next_shape_id += 1
+
+            elif comp_type == "image":
                 try:
-                    slide.shapes.add_picture(comp["src"], x, y, width=w, height=h)
+                    picture = shapes.add_picture(comp["src"], x, y, width=w, height=h)
+                    next_shape_id = picture.shape_id + 1
                 except:
                     print(f"Image not found :: {comp['src']}")
-            elif comp["type"] == "table":
-                rows = len(comp["content"]["rows"]) + 1
-                cols_t = len(comp["content"]["columns"])
-                table = slide.shapes.add_table(rows, cols_t, x, y, w, h).table
+            elif comp_type == "table":
+                columns = comp["content"]["columns"]
+                body_rows = comp["content"]["rows"]
+                graphic_frame = shapes.add_table(len(body_rows) + 1, len(columns), x, y, w, h)
+                next_shape_id = graphic_frame.shape_id + 1
+                table = graphic_frame.table
+
+                # Write cell XML directly: one parse per cell, no cell/text_frame proxies
+                tr_lst = table._tbl.tr_lst
 
                 # header
-                for j, col_name in enumerate(comp["content"]["columns"]):
-                    cell = table.cell(0, j)
-                    cell.text = col_name
-                    cell.fill.solid()
-                    cell.fill.fore_color.rgb = RGBColor.from_string(
-                        data["defaults"]["table_style"]["header_fill"].strip("#")
-                    )
-                    for p in cell.text_frame.paragraphs:
-                        p.font.color.rgb = RGBColor.from_string(
-                            data["defaults"]["table_style"]["header_color"].strip("#")
-                        )
+                for tc, col_name in zip(tr_lst[0].tc_lst, columns):
+                    tc.replace(tc.txBody, _cell_txbody(col_name, header_text_hex))
+                    tc.get_or_add_tcPr().append(parse_xml(header_fill_xml))
 
                 # rows
-                for i, row in enumerate(comp["content"]["rows"]):
-                    for j, val in enumerate(row):
-                        table.cell(i + 1, j).text = str(val)
+                for tr, row in zip(tr_lst[1:], body_rows):
+                    for tc, val in zip(tr.tc_lst, row):
+                        tc.replace(tc.txBody, _cell_txbody(str(val)))
 
             # TODO: implement richtext, charts, code rendering
 
     prs.save(output_file)
     print(f"PPT generated: {output_file}")
-create_ppt_from_json(data,)
\ No newline at end of file
+
+def main():
+    # Example deck lives next to this script
+    deck_path = Path(__file__).with_name("new_pptx_deck.json")
+    with open(deck_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    create_ppt_from_json(data)
+
+if __name__ == "__main__":
+    main()
@@ -5,10 +5,39 @@ Easy-to-use functions for integrating auto-alignment with the PowerPoint generat
 """
 
 import json
-from typing import Dict, Any, List
+import os
+import sys
+from copy import deepcopy
+from pathlib import Path
+from typing import Dict, Any, List, Tuple
+
+# Add parent directory to path (for utils.ppt_generator)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
 from grid_auto_align import auto_align_presentation, auto_align_slide_components
 
 
+# Parsed JSON per path, with the mtime it was read at
+_JSON_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+
+def _load_json(json_file_path: str) -> Dict[str, Any]:
+    """
+    Load a JSON file, reusing the parsed data while the file is unchanged.
+    
+    The returned data is shared between calls: treat it as read-only.
+    """
+    mtime_ns = os.stat(json_file_path).st_mtime_ns
+    cached = _JSON_CACHE.get(json_file_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    
+    with open(json_file_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    _JSON_CACHE[json_file_path] = (mtime_ns, data)
+    return data
+
+
 def fix_overlapping_components(json_file_path: str, output_file_path: str = None, 
                              strategy: str = "preserve_order") -> Dict[str, Any]:
     """
@@ -17,14 +46,14 @@ def fix_overlapping_components(json_file_path: str, output_file_path: str = None
     Args:
         json_file_path: Path to the input JSON file
         output_file_path: Path to save the fixed JSON (optional)
-        strategy: Alignment strategy ("preserve_order", "compact", "balanced")
+        strategy: Alignment strategy ("preserve_order", "compact", "balanced", "maxrects")
     
     Returns:
         Fixed presentation data
     """
-    # Load the JSON data
-    with open(json_file_path, 'r', encoding='utf-8') as f:
-        presentation_data = json.load(f)
+    # Load the JSON data. The parse is cached, and the result shares tokens, deck
+    # and even whole component lists with its input, so copy it before handing it out
+    presentation_data = deepcopy(_load_json(json_file_path))
     
     # Apply auto-alignment
     fixed_data = auto_align_presentation(presentation_data, strategy)
@@ -66,8 +95,7 @@ def analyze_overlaps(json_file_path: str) -> Dict[str, Any]:
     """
     from grid_auto_align import GridAutoAligner
     
-    with open(json_file_path, 'r', encoding='utf-8') as f:
-        presentation_data = json.load(f)
+    presentation_data = _load_json(json_file_path)
     
     tokens = presentation_data["tokens"]
     aligner = GridAutoAligner(tokens)
@@ -82,23 +110,22 @@ def analyze_overlaps(json_file_path: str) -> Dict[str, Any]:
         if "components" not in slide:
             continue
             
-        rects = aligner.extract_grid_rects(slide["components"])
-        overlaps = aligner.detect_overlaps(rects)
+        # validate_alignment already extracts the rects and runs detect_overlaps once
         validation = aligner.validate_alignment(slide["components"])
         
         slide_analysis = {
             "slide_index": i,
             "slide_title": slide.get("title", f"Slide {i+1}"),
-            "components_count": len(rects),
-            "overlaps_count": len(overlaps),
-            "overlapping_components": [(r1.component_id, r2.component_id) for r1, r2 in overlaps],
+            "components_count": validation["components_count"],
+            "overlaps_count": validation["overlaps_detected"],
+            "overlapping_components": validation["overlapping_pairs"],
             "total_height": validation["total_height"],
             "column_usage": validation["column_usage"]
         }
         
         analysis["slides"].append(slide_analysis)
-        analysis["total_overlaps"] += len(overlaps)
-        analysis["total_components"] += len(rects)
+        analysis["total_overlaps"] += validation["overlaps_detected"]
+        analysis["total_components"] += validation["components_count"]
     
     return analysis
 
@@ -114,10 +141,6 @@ def create_auto_aligned_presentation(input_json: str, output_json: str,
         output_pptx: PowerPoint output path
         strategy: Alignment strategy
     """
-    import subprocess
-    import sys
-    from pathlib import Path
-    
     # Step 1: Fix overlapping components
     print("🔧 Fixing overlapping components...")
     fixed_data = fix_overlapping_components(input_json, output_json, strategy)
@@ -133,25 +156,15 @@ def create_auto_aligned_presentation(input_json: str, output_json: str,
         print(f"❌ Schema file not found: {schema_path}")
         return False
     
-    # Run the PowerPoint generator
+    # Run the PowerPoint generator in-process on the already-fixed data; the schema is
+    # cached by _load_json, so repeated runs don't re-read it
     try:
-        cmd = [
-            sys.executable, "ppt-generator.py",
-            "--schema", str(schema_path),
-            "--input", output_json,
-            "--out", output_pptx
-        ]
+        from utils.ppt_generator import render_pptx
         
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=input_path.parent)
-        
-        if result.returncode == 0:
-            print(f"✅ PowerPoint generated successfully: {output_pptx}")
-            return True
-        else:
-            print(f"❌ PowerPoint generation failed:")
-            print(result.stderr)
-            return False
-            
+        # Relative output paths resolve against the input's directory, as before
+        render_pptx(fixed_data, _load_json(str(schema_path)), input_path.parent / output_pptx)
+        print(f"✅ PowerPoint generated successfully: {output_pptx}")
+        return True
     except Exception as e:
         print(f"❌ Error generating PowerPoint: {e}")
         return False
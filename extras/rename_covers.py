@@ -4,8 +4,12 @@ Rename slide_XX_image_1.jpg files to cover_XX.jpg
 """
 
 import os
+import re
 from pathlib import Path
 
+# slide_XX_image_1.jpg, capturing XX
+COVER_FILE_RE = re.compile(r"^slide_(\d+)_image_1\.jpg$")
+
 def main():
     images_dir = Path("/Users/ahmshalan/Projects/mobifly/ppt-generate/branding/covers/images")
     
@@ -13,8 +17,14 @@ def main():
         print(f"Error: Directory not found: {images_dir}")
         return
     
-    # Get all files matching the pattern
-    files = sorted(images_dir.glob("slide_*_image_1.jpg"))
+    # Get all files matching the pattern: one directory read, no Path per entry
+    files = []
+    with os.scandir(images_dir) as entries:
+        for entry in entries:
+            match = COVER_FILE_RE.match(entry.name)
+            if match:
+                files.append((entry.name, match.group(1), entry.path))
+    files.sort()
     
     if not files:
         print("No files matching pattern 'slide_*_image_1.jpg' found")
@@ -23,21 +33,15 @@ def main():
     print(f"Found {len(files)} files to rename\n")
     
     renamed_count = 0
-    for file_path in files:
-        # Extract the slide number from the filename
-        filename = file_path.name
-        parts = filename.split("_")
-        if len(parts) >= 3:
-            slide_num = parts[1]  # Gets '01', '02', etc.
-            new_filename = f"cover_{slide_num}.jpg"
-            new_path = images_dir / new_filename
-            
-            try:
-                file_path.rename(new_path)
-                print(f"✓ Renamed: {filename} -> {new_filename}")
-                renamed_count += 1
-            except Exception as e:
-                print(f"✗ Error renaming {filename}: {e}")
+    for filename, slide_num, file_path in files:
+        new_filename = f"cover_{slide_num}.jpg"
+        
+        try:
+            os.rename(file_path, images_dir / new_filename)
+            print(f"✓ Renamed: {filename} -> {new_filename}")
+            renamed_count += 1
+        except Exception as e:
+            print(f"✗ Error renaming {filename}: {e}")
     
     print(f"\n{'='*60}")
     print(f"✓ Renaming complete!")
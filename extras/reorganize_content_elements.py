@@ -4,10 +4,30 @@ Reorganize content elements into separate directories by layout type.
 This makes it easier for AI agents to select appropriate templates.
 """
 
+import hashlib
 import json
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+def file_sha256(path: Path) -> bytes:
+    """SHA-256 digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.digest()
+
+def link_or_copy(source: Path, target: Path):
+    """Hard-link target to source, falling back to a copy (e.g. across filesystems)."""
+    try:
+        if target.exists():
+            target.unlink()
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
 def reorganize_content_elements():
     """Reorganize content elements into categorized directories"""
     
@@ -79,38 +99,57 @@ def reorganize_content_elements():
             "elements": []
         }
     
-    # Copy and organize files
-    print("Organizing content elements by layout type...\n")
+    # Category -> layout directory it belongs to (first match wins)
+    layout_for_category = {}
+    for layout_type, info in layout_categories.items():
+        for category in info['categories']:
+            layout_for_category.setdefault(category, layout_type)
     
+    # Collect the copies first so they can run concurrently
+    tasks = []
     for element in index['elements']:
-        category = element['category']
         element_file = element['file']
         source_file = elements_dir / element_file
+        target_layout = layout_for_category.get(element['category'])
         
-        # Find which layout directory this belongs to
-        target_layout = None
-        for layout_type, info in layout_categories.items():
-            if category in info['categories']:
-                target_layout = layout_type
-                break
+        if target_layout and source_file.exists():
+            target_file = base_dir / target_layout / element_file
+            tasks.append((source_file, target_file, element, target_layout))
+    
+    # Copy and organize files (I/O-bound, so threads overlap the filesystem calls)
+    print("Organizing content elements by layout type...\n")
+    
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Byte-identical templates are copied once; the other targets hard-link to that copy
+        digests = list(executor.map(lambda task: file_sha256(task[0]), tasks))
+        canonical = {}
+        copies = []
+        links = []
+        for task, digest in zip(tasks, digests):
+            if digest in canonical:
+                links.append((canonical[digest], task[1]))
+            else:
+                canonical[digest] = task[1]
+                copies.append(task)
         
-        if target_layout:
-            # Copy file to appropriate directory
-            target_dir = base_dir / target_layout
-            target_file = target_dir / element_file
-            
-            if source_file.exists():
-                shutil.copy2(source_file, target_file)
-                
-                organized_structure[target_layout]["count"] += 1
-                organized_structure[target_layout]["elements"].append({
-                    "id": element["id"],
-                    "file": element_file,
-                    "category": category,
-                    "description": element["description"]
-                })
-                
-                print(f"✓ {element_file} → {target_layout}/")
+        list(executor.map(lambda task: shutil.copy2(task[0], task[1]), copies))
+        list(executor.map(lambda link: link_or_copy(*link), links))
+    
+    # Progress lines are collected and written once instead of one print per file
+    progress = []
+    for source_file, target_file, element, target_layout in tasks:
+        organized_structure[target_layout]["count"] += 1
+        organized_structure[target_layout]["elements"].append({
+            "id": element["id"],
+            "file": element['file'],
+            "category": element['category'],
+            "description": element["description"]
+        })
+        
+        progress.append(f"✓ {element['file']} → {target_layout}/")
+    if progress:
+        print("\n".join(progress))
     
     # Create index files for each category
     print("\nCreating category index files...\n")
@@ -6,10 +6,23 @@ Reorganize PwC cover images:
 - Update JSON files with correct references
 """
 
+import hashlib
 import json
+import re
 import shutil
 from pathlib import Path
 
+# cover_XX_image_N.png/.jpg, capturing XX, N and the extension
+COVER_IMG_RE = re.compile(r'cover_(\d{2})_image_(\d+)\.(png|jpg)')
+
+def file_sha256(path: Path) -> bytes:
+    """SHA-256 digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.digest()
+
 def main():
     covers_dir = Path("/Users/ahmshalan/Projects/mobifly/ppt-generate/branding/covers")
     images_dir = covers_dir / "images"
@@ -20,14 +33,18 @@ def main():
     
     # Move the first PwC logo image to logo directory
     first_logo = images_dir / "cover_01_image_1.png"
+    logo_digest = None
     if first_logo.exists():
         logo_dest = logo_dir / "pwc_logo.png"
         shutil.copy2(first_logo, logo_dest)
+        logo_digest = file_sha256(first_logo)
         print(f"✓ Copied PwC logo to: {logo_dest}")
     
     # Process each cover
     total_deleted = 0
     total_updated = 0
+    # Per-cover progress lines, written once after the loop
+    progress = []
     
     for cover_num in range(1, 76):
         json_file = covers_dir / f"cover_{cover_num:02d}_title_subtitle.json"
@@ -44,54 +61,64 @@ def main():
         
         # Update image references
         for component in components:
-            if component['type'] == 'image':
-                src = component.get('src', '')
+            if component['type'] != 'image':
+                continue
+            
+            match = COVER_IMG_RE.search(component.get('src', ''))
+            if not match or int(match.group(1)) != cover_num:
+                continue
+            image_num, ext = match.group(2), match.group(3)
+            
+            # The logo (image_1.png)
+            if image_num == '1' and ext == 'png':
+                logo_file = images_dir / f"cover_{cover_num:02d}_image_1.png"
+                
+                # Only treat it as the shared logo if the content really is the logo
+                if (logo_file.exists() and logo_digest is not None
+                        and file_sha256(logo_file) != logo_digest):
+                    progress.append(f"  Keeping {logo_file.name}: content differs from the PwC logo")
+                    continue
+                
+                # Update to reference shared logo
+                component['src'] = 'logo/pwc_logo.png'
+                updated = True
                 
-                # Check if it's the logo (image_1)
-                if f'cover_{cover_num:02d}_image_1' in src:
-                    # Update to reference shared logo
-                    component['src'] = 'logo/pwc_logo.png'
+                # Delete the duplicate logo file
+                if logo_file.exists() and cover_num > 1:  # Keep the first one as source
+                    logo_file.unlink()
+                    total_deleted += 1
+            
+            # A JPEG image_1 is a background photo (e.g. cover_02), not the logo
+            elif image_num == '1':
+                new_filename = f"cover_{cover_num:02d}_photo.{ext}"
+                old_path = images_dir / f"cover_{cover_num:02d}_image_1.{ext}"
+                if old_path.exists():
+                    shutil.move(old_path, images_dir / new_filename)
+                    component['src'] = f'images/{new_filename}'
                     updated = True
-                    
-                    # Delete the duplicate logo file
-                    logo_file = images_dir / f"cover_{cover_num:02d}_image_1.png"
-                    if logo_file.exists() and cover_num > 1:  # Keep the first one as source
-                        logo_file.unlink()
-                        total_deleted += 1
+            
+            # A cover photo (image_2) - rename to simpler name
+            elif image_num == '2':
+                old_filename = f"cover_{cover_num:02d}_image_2.{ext}"
+                new_filename = f"cover_{cover_num:02d}.{ext}"
                 
-                # Check if it's a cover photo (image_2) - rename to simpler name
-                elif f'cover_{cover_num:02d}_image_2' in src:
-                    old_filename = f"cover_{cover_num:02d}_image_2.png"
-                    new_filename = f"cover_{cover_num:02d}.png"
-                    
-                    old_path = images_dir / old_filename
-                    new_path = images_dir / new_filename
-                    
-                    if old_path.exists():
-                        shutil.move(str(old_path), str(new_path))
-                        component['src'] = f'images/{new_filename}'
-                        updated = True
-        
-        # For cover_02, also handle the JPEG background image
-        if cover_num == 2:
-            for component in components:
-                if component['type'] == 'image':
-                    src = component.get('src', '')
-                    if 'cover_02_image_1.jpg' in src:
-                        # This is the background photo for cover 2
-                        old_path = images_dir / 'cover_02_image_1.jpg'
-                        new_path = images_dir / 'cover_02_photo.jpg'
-                        if old_path.exists():
-                            shutil.move(str(old_path), str(new_path))
-                            component['src'] = 'images/cover_02_photo.jpg'
-                            updated = True
+                old_path = images_dir / old_filename
+                new_path = images_dir / new_filename
+                
+                if old_path.exists():
+                    shutil.move(old_path, new_path)
+                    component['src'] = f'images/{new_filename}'
+                    updated = True
         
         # Save updated JSON
         if updated:
             with open(json_file, 'w', encoding='utf-8') as f:
                 json.dump(cover_data, f, indent=2, ensure_ascii=False)
             total_updated += 1
-            print(f"✓ Updated: cover_{cover_num:02d}_title_subtitle.json")
+            progress.append(f"✓ Updated: cover_{cover_num:02d}_title_subtitle.json")
+    
+    if progress:
+        print("\n".join(progress))
     
     print(f"\n✓ Reorganization complete!")
     print(f"  Logo saved to: {logo_dir}/pwc_logo.png")
@@ -4,6 +4,7 @@ Test the auto-alignment functionality with sample data.
 """
 
 import json
+from hashlib import blake2b
 from grid_auto_align import auto_align_presentation, GridAutoAligner
 
 
@@ -89,8 +90,9 @@ def test_auto_alignment():
             grid = comp["grid"]
             print(f"   {i+1}. {comp['type']} - col:{grid['col']}, span:{grid['span']}, y:{grid['y']}, h:{grid['row_h']}")
     
-    # Validate the result
-    validation = fixed_data["slides"][0]["_alignment_validation"]
+    # Validate the result (not stored on the slide, to keep it schema-clean)
+    aligner = GridAutoAligner(test_data["tokens"])
+    validation = aligner.validate_alignment(fixed_data["slides"][0]["components"])
     print(f"\n📊 Validation Results:")
     print(f"   Overlaps detected: {validation['overlaps_detected']}")
     print(f"   Total height: {validation['total_height']:.1f}px")
@@ -100,17 +102,49 @@ def test_auto_alignment():
     # Test different strategies
     print("\n🔄 Testing different strategies...")
     
-    strategies = ["preserve_order", "compact", "balanced"]
+    strategies = ["preserve_order", "compact", "balanced", "maxrects"]
     for strategy in strategies:
         print(f"\n   Strategy: {strategy}")
         strategy_data = auto_align_presentation(test_data, strategy=strategy)
-        strategy_validation = strategy_data["slides"][0]["_alignment_validation"]
+        strategy_validation = aligner.validate_alignment(strategy_data["slides"][0]["components"])
         print(f"   - Total height: {strategy_validation['total_height']:.1f}px")
         print(f"   - Overlaps: {strategy_validation['overlaps_detected']}")
     
     return fixed_data
 
 
+def test_over_wide_component():
+    """A component spanning more columns than the grid must still be placed."""
+    print("\n" + "="*50)
+    print("🧪 Testing component wider than the grid\n")
+    
+    aligner = GridAutoAligner({"grid": {"columns": 12}, "spacing": {"margin": 48, "gutter": 12}})
+    components = [{"type": "text", "grid": {"col": 1, "span": 13, "y": 0, "row_h": 50}}]
+    
+    for strategy in ["preserve_order", "compact", "balanced", "maxrects"]:
+        aligned = aligner.auto_align_components(components, strategy)
+        grid = aligned[0]["grid"]
+        assert grid["col"] == 1, f"{strategy}: expected col 1, got {grid['col']}"
+        # Nothing else is placed, so it must stay at the top of the slide
+        assert 0 <= grid["y"] <= aligner.gutter, f"{strategy}: expected y near 0, got {grid['y']}"
+        print(f"   {strategy}: col={grid['col']}, y={grid['y']}")
+    
+    # Below an existing component it goes just under it, not far down the slide
+    components = [
+        {"type": "text", "grid": {"col": 3, "span": 4, "y": 0, "row_h": 50}},
+        {"type": "text", "grid": {"col": 1, "span": 13, "y": 10, "row_h": 50}},
+    ]
+    grid = aligner.auto_align_components(components, "preserve_order")[1]["grid"]
+    assert grid["col"] == 1 and 50 <= grid["y"] <= 50 + aligner.gutter, f"got {grid}"
+    print(f"   preserve_order below a component: col={grid['col']}, y={grid['y']}")
+    
+    # The already-settled fast path must still hand back copies, like every other path
+    components = [{"type": "text", "grid": {"col": 1, "span": 6, "y": 0, "row_h": 50}}]
+    aligned = aligner.auto_align_components(components, "preserve_order")
+    assert aligned is not components and aligned[0]["grid"] is not components[0]["grid"]
+    print("   ✅ Settled components are returned as a copy")
+
+
 def test_with_real_data():
     """Test with the actual sample data."""
     print("\n" + "="*50)
@@ -125,15 +159,21 @@ def test_with_real_data():
         # Analyze overlaps in original data
         aligner = GridAutoAligner(real_data["tokens"])
         total_overlaps = 0
+        # Overlap count per components layout; repeated template slides are scored once
+        overlaps_by_layout = {}
         
         for i, slide in enumerate(real_data["slides"]):
             if "components" not in slide:
                 continue
-            rects = aligner.extract_grid_rects(slide["components"])
-            overlaps = aligner.detect_overlaps(rects)
-            if overlaps:
-                print(f"   Slide {i+1} ({slide.get('title', 'Untitled')}): {len(overlaps)} overlaps")
-                total_overlaps += len(overlaps)
+            layout_key = blake2b(json.dumps(slide["components"], sort_keys=True).encode(),
+                                 digest_size=16).digest()
+            overlap_count = overlaps_by_layout.get(layout_key)
+            if overlap_count is None:
+                rects = aligner.extract_grid_rects(slide["components"])
+                overlap_count = overlaps_by_layout[layout_key] = len(aligner.detect_overlap_indices(rects))
+            if overlap_count:
+                print(f"   Slide {i+1} ({slide.get('title', 'Untitled')}): {overlap_count} overlaps")
+                total_overlaps += overlap_count
         
         if total_overlaps == 0:
             print("   ✅ No overlaps found in original data")
@@ -157,6 +197,7 @@ def test_with_real_data():
 if __name__ == "__main__":
     # Run tests
     test_auto_alignment()
+    test_over_wide_component()
     test_with_real_data()
     
     print("\n" + "="*50)
@@ -5,26 +5,31 @@ Test the extraction on slide 2 specifically to verify font properties
 
 import json
 import sys
+from functools import lru_cache
 from pathlib import Path
 from pptx import Presentation
 
 # Add the parent directory to the path
 sys.path.insert(0, str(Path(__file__).parent))
 
-# Import the functions from extract_content_elements
-exec(open('extract_content_elements.py').read())
+from extract_content_elements import extract_slide_to_json
 
-def test_slide_2():
-    elements_file = Path("/Users/ahmshalan/Projects/mobifly/ppt-generate/branding/PwC_ppt_graphic_elements_level1.pptx")
-    
+ELEMENTS_FILE = Path("/Users/ahmshalan/Projects/mobifly/ppt-generate/branding/PwC_ppt_graphic_elements_level1.pptx")
+
+@lru_cache(maxsize=1)
+def load_elements_presentation():
+    """Unzip and parse the elements deck once; every slide check reuses it."""
     print("Loading presentation...")
-    prs = Presentation(str(elements_file))
+    return Presentation(str(ELEMENTS_FILE))
+
+def test_slide_2(slide_num=2):
+    prs = load_elements_presentation()
     
-    # Get slide 2 (index 1)
-    slide = prs.slides[1]
+    # slide_num is 1-based; prs.slides is 0-based
+    slide = prs.slides[slide_num - 1]
     
-    print("\nExtracting slide 2...")
-    element_json = extract_slide_to_json(slide, 2)
+    print(f"\nExtracting slide {slide_num}...")
+    element_json = extract_slide_to_json(slide, slide_num)
     
     print("\n=== EXTRACTED JSON ===")
     print(json.dumps(element_json, indent=2))
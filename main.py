@@ -50,11 +50,11 @@ def custom_openapi():
         }
     }
 
-    for path in openapi_schema["paths"]:
-        for method in openapi_schema["paths"][path]:
-            openapi_schema["paths"][path][method]["security"] = [
-                {"OAuth2PasswordBearer": []}
-            ]
+    # One shared requirement list; nothing mutates it after the schema is built
+    security = [{"OAuth2PasswordBearer": []}]
+    for path_item in openapi_schema["paths"].values():
+        for operation in path_item.values():
+            operation["security"] = security
 
     app.openapi_schema = openapi_schema
     return app.openapi_schema
@@ -91,6 +91,44 @@ async def global_exception_handler(request, exc: Exception):
     )
 
 
+def _bad_request_error(detail: str) -> dict:
+    return {"message": VALIDATED_FAILED, "errors": [{"field": "general", "error": detail}]}
+
+
+def _unauthorized_error(detail: str) -> dict:
+    return {
+        "message": "Unauthorized",
+        "errors": [
+            {
+                "field": "Authorization",
+                "error": "JWT token is missing, invalid or expired.",
+            }
+        ],
+    }
+
+
+def _forbidden_error(detail: str) -> dict:
+    error = detail if detail else "You do not have permission to perform this action."
+    return {"message": "Forbidden", "errors": [{"field": "role", "error": error}]}
+
+
+def _conflict_error(detail: str) -> dict:
+    return {"message": "Conflict", "errors": [{"field": "email", "error": detail}]}
+
+
+def _default_error(detail: str) -> dict:
+    return {"message": detail}
+
+
+# Error body builders for string details, keyed by status code
+HTTP_ERROR_BUILDERS = {
+    400: _bad_request_error,
+    401: _unauthorized_error,
+    403: _forbidden_error,
+    409: _conflict_error,
+}
+
+
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     logger.error(f"HTTPException: {exc.status_code} - {exc.detail}")
@@ -101,7 +139,6 @@ async def http_exception_handler(request: Request, exc: HTTPException):
     }
 
     if isinstance(exc.detail, dict) and "errors" in exc.detail:
-        logger.error(f"HTTPException: {exc.status_code} - {exc.detail}")
         error_response.update(
             {
                 "message": exc.detail.get("message", VALIDATED_FAILED),
@@ -109,36 +146,8 @@ async def http_exception_handler(request: Request, exc: HTTPException):
             }
         )
     elif isinstance(exc.detail, str):
-        if exc.status_code == 400:
-            logger.error(f"HTTPException: {exc.status_code} - {exc.detail}")
-            error_response["message"] = VALIDATED_FAILED
-            error_response["errors"] = [{"field": "general", "error": exc.detail}]
-        elif exc.status_code == 401:
-            logger.error(f"HTTPException: {exc.status_code} - {exc.detail}")
-            error_response["message"] = "Unauthorized"
-            error_response["errors"] = [
-                {
-                    "field": "Authorization",
-                    "error": "JWT token is missing, invalid or expired.",
-                }
-            ]
-        elif exc.status_code == 403:
-            logger.error(f"HTTPException: {exc.status_code} - {exc.detail}")
-            error = exc.detail if exc.detail else "You do not have permission to perform this action."
-            error_response["message"] = "Forbidden"
-            error_response["errors"] = [
-                {
-                    "field": "role",
-                    "error": error,
-                }
-            ]
-        elif exc.status_code == 409:
-            logger.error(f"HTTPException: {exc.status_code} - {exc.detail}")
-            error_response["message"] = "Conflict"
-            error_response["errors"] = [{"field": "email", "error": exc.detail}]
-        else:
-            logger.error(f"HTTPException: {exc.status_code} - {exc.detail}")
-            error_response["message"] = exc.detail
+        build_error = HTTP_ERROR_BUILDERS.get(exc.status_code, _default_error)
+        error_response.update(build_error(exc.detail))
 
     logger.error(f"HTTPException: {exc.status_code} - {error_response}")
     return JSONResponse(
@@ -169,4 +178,15 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     )
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=5252)
+    # Import string (not the app object) so uvicorn can spawn workers; loop="auto"
+    # picks uvloop when it is installed (it has no Windows build) and asyncio otherwise
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=5252,
+        loop="auto",
+        http="httptools",
+        # One process unless WEB_CONCURRENCY asks for more: every worker shares the
+        # same rotating loguru file sink, which is not multi-process safe
+        workers=int(os.getenv("WEB_CONCURRENCY", 1)),
+    )
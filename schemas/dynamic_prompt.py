@@ -6,41 +6,57 @@ from schemas.prompt import LLM_PROMPT
 from schemas.pwc_layout_patterns import get_pwc_layout_guidance
 
 
-def build_prompt_with_templates(user_input: str) -> str:
-    """
-    Build LLM prompt with PwC layout patterns
-    
-    Args:
-        user_input: User's presentation request
-    
-    Returns:
-        Complete prompt with layout guidance
-    """
-    
+# Section rule used in LLM_PROMPT; the layout patterns go after the second section
+SECTION_SEPARATOR = "══════════════════════════════════════════════════════════════════════════════"
+
+
+def _build_enhanced_prompt() -> str:
+    """LLM_PROMPT with the PwC layout patterns inserted (placeholder still in place)."""
     # Get PwC layout patterns
     layout_guidance = get_pwc_layout_guidance()
     
     # Insert layout patterns into the prompt
     # Find insertion point - right after the template selection section
-    prompt_parts = LLM_PROMPT.split("══════════════════════════════════════════════════════════════════════════════")
+    prompt_parts = LLM_PROMPT.split(SECTION_SEPARATOR)
     
     if len(prompt_parts) >= 3:
         # Insert after "TEMPLATE SELECTION SYSTEM" section, before "PwC BRANDING GUIDELINES"
-        enhanced_prompt = (
+        return (
             prompt_parts[0] +
-            "══════════════════════════════════════════════════════════════════════════════" +
+            SECTION_SEPARATOR +
             prompt_parts[1] +
             "\n\n" +
             layout_guidance +
-            "\n\n══════════════════════════════════════════════════════════════════════════════" +
-            "══════════════════════════════════════════════════════════════════════════════".join(prompt_parts[2:])
+            "\n\n" + SECTION_SEPARATOR +
+            SECTION_SEPARATOR.join(prompt_parts[2:])
         )
-    else:
-        # Fallback: prepend before the prompt
-        enhanced_prompt = layout_guidance + "\n\n" + LLM_PROMPT
+    # Fallback: prepend before the prompt
+    return layout_guidance + "\n\n" + LLM_PROMPT
+
+
+# Both inputs are constants, so split and splice once at import rather than per request
+ENHANCED_PROMPT = _build_enhanced_prompt()
+
+INPUT_PLACEHOLDER = "{input_information}"
+assert ENHANCED_PROMPT.count(INPUT_PLACEHOLDER) == 1, "prompt must have exactly one {input_information}"
+
+# Split around the placeholder once so each request is a plain concatenation
+# with no scan of the template
+PROMPT_HEAD, PROMPT_TAIL = ENHANCED_PROMPT.split(INPUT_PLACEHOLDER)
+
+
+def build_prompt_with_templates(user_input: str) -> str:
+    """
+    Build LLM prompt with PwC layout patterns
+    
+    Args:
+        user_input: User's presentation request
     
+    Returns:
+        Complete prompt with layout guidance
+    """
     # Add user input
-    final_prompt = enhanced_prompt.format(input_information=user_input)
+    final_prompt = PROMPT_HEAD + user_input + PROMPT_TAIL
     
     return final_prompt
 
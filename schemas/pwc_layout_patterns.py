@@ -3,6 +3,11 @@ PwC Layout Patterns for LLM Guidance
 Clear, grid-based layout patterns with proper PwC branding
 """
 
+import json
+import os
+import re
+import sys
+
 PWC_LAYOUT_PATTERNS = """
 ══════════════════════════════════════════════════════════════════════════════
  PwC SLIDE LAYOUT PATTERNS (MANDATORY - FOLLOW THESE EXACTLY)
@@ -18,15 +23,15 @@ PATTERN 1: TITLE SLIDE (Use for first slide, section intros)
 NOTE: Many PwC title slides use a beige/cream background (#FFE8D4) instead of white.
 Consider using #FFE8D4 for a warm, professional look matching PwC templates.
 
-{{
+{
   "title": "Your Title",
-  "background": {{"type": "solid", "color": "#FFE8D4"}},
+  "background": {"type": "solid", "color": "#FFE8D4"},
   "components": [
-    {{
+    {
       "type": "text",
       "text_type": "title",
       "value": "Your Main Title Here",
-      "style": {{
+      "style": {
         "font_family": "Georgia",
         "font_size": 44,
         "bold": true,
@@ -36,14 +41,14 @@ Consider using #FFE8D4 for a warm, professional look matching PwC templates.
         "valign": "middle",
         "border_color": "#E0301E",
         "border_width": 0
-      }},
-      "grid": {{"col": 1, "span": 12, "row_h": 2, "y": 1}}
-    }},
-    {{
+      },
+      "grid": {"col": 1, "span": 12, "row_h": 2, "y": 1}
+    },
+    {
       "type": "text",
       "text_type": "body",
       "value": "Subtitle or description text here",
-      "style": {{
+      "style": {
         "font_family": "Georgia",
         "font_size": 18,
         "bold": false,
@@ -53,23 +58,23 @@ Consider using #FFE8D4 for a warm, professional look matching PwC templates.
         "valign": "top",
         "border_color": "#CCCCCC",
         "border_width": 0
-      }},
-      "grid": {{"col": 2, "span": 9, "row_h": 5, "y": 3.5}}
-    }}
+      },
+      "grid": {"col": 2, "span": 9, "row_h": 5, "y": 3.5}
+    }
   ]
-}}
+}
 
 ────────────────────────────────────────────────────────────────────────────
 PATTERN 2: CONTENT WITH IMAGE (Standard content + visual)
 ────────────────────────────────────────────────────────────────────────────
 
-{{
+{
   "components": [
-    {{
+    {
       "type": "text",
       "text_type": "h2",
       "value": "Section Heading",
-      "style": {{
+      "style": {
         "font_family": "Arial",
         "font_size": 28,
         "bold": true,
@@ -79,16 +84,16 @@ PATTERN 2: CONTENT WITH IMAGE (Standard content + visual)
         "valign": "top",
         "border_color": "#FFFFFF",
         "border_width": 0
-      }},
-      "grid": {{"col": 1, "span": 10, "row_h": 1, "y": 0.5}}
-    }},
-    {{
+      },
+      "grid": {"col": 1, "span": 10, "row_h": 1, "y": 0.5}
+    },
+    {
       "type": "richtext",
       "runs": [
-        {{"text": "Key Point:", "bold": true, "font_family": "Arial", "font_size": 20, "color": "#E0301E"}},
-        {{"text": "\\n• Bullet point 1\\n• Bullet point 2", "font_family": "Georgia", "font_size": 18, "color": "#2D2D2D"}}
+        {"text": "Key Point:", "bold": true, "font_family": "Arial", "font_size": 20, "color": "#E0301E"},
+        {"text": "\\n• Bullet point 1\\n• Bullet point 2", "font_family": "Georgia", "font_size": 18, "color": "#2D2D2D"}
       ],
-      "style": {{
+      "style": {
         "font_family": "Georgia",
         "font_size": 18,
         "color": "#2D2D2D",
@@ -97,29 +102,29 @@ PATTERN 2: CONTENT WITH IMAGE (Standard content + visual)
         "valign": "top",
         "border_color": "#CCCCCC",
         "border_width": 0
-      }},
-      "grid": {{"col": 1, "span": 6, "row_h": 6, "y": 2}}
-    }},
-    {{
+      },
+      "grid": {"col": 1, "span": 6, "row_h": 6, "y": 2}
+    },
+    {
       "type": "image",
       "src": "https://images.unsplash.com/photo-...",
       "alt": "Descriptive text",
-      "grid": {{"col": 8, "span": 5, "row_h": 5, "y": 2.5}}
-    }}
+      "grid": {"col": 8, "span": 5, "row_h": 5, "y": 2.5}
+    }
   ]
-}}
+}
 
 ────────────────────────────────────────────────────────────────────────────
 PATTERN 3: DATA TABLE (Structured information)
 ────────────────────────────────────────────────────────────────────────────
 
-{{
+{
   "components": [
-    {{
+    {
       "type": "text",
       "text_type": "h2",
       "value": "Data Overview",
-      "style": {{
+      "style": {
         "font_family": "Arial",
         "font_size": 28,
         "bold": true,
@@ -129,19 +134,19 @@ PATTERN 3: DATA TABLE (Structured information)
         "valign": "top",
         "border_color": "#FFFFFF",
         "border_width": 0
-      }},
-      "grid": {{"col": 1, "span": 10, "row_h": 1, "y": 0.5}}
-    }},
-    {{
+      },
+      "grid": {"col": 1, "span": 10, "row_h": 1, "y": 0.5}
+    },
+    {
       "type": "table",
-      "content": {{
+      "content": {
         "columns": ["Metric", "Value", "Status"],
         "rows": [
           ["Revenue", "$500K", "On Track"],
           ["Growth", "15%", "Exceeded"]
         ]
-      }},
-      "style": {{
+      },
+      "style": {
         "font_family": "Georgia",
         "font_size": 16,
         "color": "#2D2D2D",
@@ -150,23 +155,23 @@ PATTERN 3: DATA TABLE (Structured information)
         "border_width": 2,
         "align": "left",
         "valign": "top"
-      }},
-      "grid": {{"col": 1, "span": 7, "row_h": 5, "y": 2}}
-    }}
+      },
+      "grid": {"col": 1, "span": 7, "row_h": 5, "y": 2}
+    }
   ]
-}}
+}
 
 ────────────────────────────────────────────────────────────────────────────
 PATTERN 4: TWO-COLUMN COMPARISON (Side-by-side content)
 ────────────────────────────────────────────────────────────────────────────
 
-{{
+{
   "components": [
-    {{
+    {
       "type": "text",
       "text_type": "h2",
       "value": "Comparison Title",
-      "style": {{
+      "style": {
         "font_family": "Arial",
         "font_size": 28,
         "bold": true,
@@ -176,16 +181,16 @@ PATTERN 4: TWO-COLUMN COMPARISON (Side-by-side content)
         "valign": "top",
         "border_color": "#FFFFFF",
         "border_width": 0
-      }},
-      "grid": {{"col": 1, "span": 10, "row_h": 1, "y": 0.5}}
-    }},
-    {{
+      },
+      "grid": {"col": 1, "span": 10, "row_h": 1, "y": 0.5}
+    },
+    {
       "type": "richtext",
       "runs": [
-        {{"text": "Left Column\\n", "bold": true, "font_family": "Arial", "font_size": 20, "color": "#E0301E"}},
-        {{"text": "• Point 1\\n• Point 2", "font_family": "Georgia", "font_size": 18, "color": "#2D2D2D"}}
+        {"text": "Left Column\\n", "bold": true, "font_family": "Arial", "font_size": 20, "color": "#E0301E"},
+        {"text": "• Point 1\\n• Point 2", "font_family": "Georgia", "font_size": 18, "color": "#2D2D2D"}
       ],
-      "style": {{
+      "style": {
         "font_family": "Georgia",
         "font_size": 18,
         "color": "#2D2D2D",
@@ -194,16 +199,16 @@ PATTERN 4: TWO-COLUMN COMPARISON (Side-by-side content)
         "valign": "top",
         "border_color": "#CCCCCC",
         "border_width": 0
-      }},
-      "grid": {{"col": 1, "span": 5, "row_h": 6, "y": 2}}
-    }},
-    {{
+      },
+      "grid": {"col": 1, "span": 5, "row_h": 6, "y": 2}
+    },
+    {
       "type": "richtext",
       "runs": [
-        {{"text": "Right Column\\n", "bold": true, "font_family": "Arial", "font_size": 20, "color": "#E0301E"}},
-        {{"text": "• Point A\\n• Point B", "font_family": "Georgia", "font_size": 18, "color": "#2D2D2D"}}
+        {"text": "Right Column\\n", "bold": true, "font_family": "Arial", "font_size": 20, "color": "#E0301E"},
+        {"text": "• Point A\\n• Point B", "font_family": "Georgia", "font_size": 18, "color": "#2D2D2D"}
       ],
-      "style": {{
+      "style": {
         "font_family": "Georgia",
         "font_size": 18,
         "color": "#2D2D2D",
@@ -212,11 +217,11 @@ PATTERN 4: TWO-COLUMN COMPARISON (Side-by-side content)
         "valign": "top",
         "border_color": "#CCCCCC",
         "border_width": 0
-      }},
-      "grid": {{"col": 7, "span": 5, "row_h": 6, "y": 2}}
-    }}
+      },
+      "grid": {"col": 7, "span": 5, "row_h": 6, "y": 2}
+    }
   ]
-}}
+}
 
 ────────────────────────────────────────────────────────────────────────────
 MANDATORY LAYOUT RULES:
@@ -226,20 +231,20 @@ MANDATORY LAYOUT RULES:
    ALL slides MUST include these TWO footer components as the LAST two components:
    
    A) Presentation Title Footer (bottom center):
-   {{
+   {
      "type": "richtext",
-     "runs": [{{"text": "YOUR_PRESENTATION_TITLE", "bold": false, "font_size": 10.5, "font_family": "Arial", "color": "#2D2D2D"}}],
-     "box": {{"x": 112, "y": 682, "w": 925, "h": 16, "unit": "px"}},
-     "style": {{"align": "left", "font_family": "Arial", "font_size": 10.5, "color": "#2D2D2D"}}
-   }}
+     "runs": [{"text": "YOUR_PRESENTATION_TITLE", "bold": false, "font_size": 10.5, "font_family": "Arial", "color": "#2D2D2D"}],
+     "box": {"x": 112, "y": 682, "w": 925, "h": 16, "unit": "px"},
+     "style": {"align": "left", "font_family": "Arial", "font_size": 10.5, "color": "#2D2D2D"}
+   }
    
    B) PwC Branding Footer (bottom left):
-   {{
+   {
      "type": "richtext",
-     "runs": [{{"text": "PwC", "bold": true, "font_size": 12, "font_family": "Arial", "color": "#000000"}}],
-     "box": {{"x": 42, "y": 682, "w": 60, "h": 20, "unit": "px"}},
-     "style": {{"align": "left", "font_family": "Arial", "font_size": 12, "color": "#000000"}}
-   }}
+     "runs": [{"text": "PwC", "bold": true, "font_size": 12, "font_family": "Arial", "color": "#000000"}],
+     "box": {"x": 42, "y": 682, "w": 60, "h": 20, "unit": "px"},
+     "style": {"align": "left", "font_family": "Arial", "font_size": 12, "color": "#000000"}
+   }
 
 2. ALWAYS use grid layout (not box) for content components
 3. ALWAYS include complete style objects with:
@@ -279,6 +284,43 @@ YOUR OUTPUT MUST MATCH THESE STRUCTURES WITH YOUR CONTENT.
 ══════════════════════════════════════════════════════════════════════════════
 """
 
+# A JSON example starts on a line holding only "{"
+_JSON_EXAMPLE_START = re.compile(r"^[ \t]*\{[ \t]*$", re.MULTILINE)
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _minify_prompt(text: str) -> str:
+    """
+    Compact the embedded JSON examples and shorten the banner rules.
+
+    Indentation and box-drawing runs are sent to the LLM as tokens on every
+    request without carrying any information.
+    """
+    parts = []
+    pos = 0
+    for match in _JSON_EXAMPLE_START.finditer(text):
+        start = text.index("{", match.start())
+        if start < pos:
+            continue
+        try:
+            example, end = _JSON_DECODER.raw_decode(text, start)
+        except json.JSONDecodeError:
+            continue
+        parts.append(text[pos:start])
+        parts.append(json.dumps(example, separators=(",", ":"), ensure_ascii=False))
+        pos = end
+    parts.append(text[pos:])
+    text = "".join(parts)
+
+    text = re.sub("═{3,}", "===", text)
+    return re.sub("─{3,}", "---", text)
+
+
+# Set DEBUG_PROMPTS to send the patterns exactly as written above
+if not os.getenv("DEBUG_PROMPTS"):
+    PWC_LAYOUT_PATTERNS = _minify_prompt(PWC_LAYOUT_PATTERNS)
+PWC_LAYOUT_PATTERNS = sys.intern(PWC_LAYOUT_PATTERNS)
+
 def get_pwc_layout_guidance() -> str:
     """Get PwC layout patterns for LLM prompt"""
     return PWC_LAYOUT_PATTERNS
@@ -1,7 +1,11 @@
+import asyncio
 import openai
 import json
+import math
 import traceback
 import tempfile
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 from utils.ppt_generator import render_pptx
 from utils.json_validator import  validate_and_fix
@@ -9,6 +13,7 @@ from schemas.prompt import LLM_PROMPT
 from schemas.dynamic_prompt import build_prompt_with_templates
 from fastapi import HTTPException
 from fastapi.responses import FileResponse
+from opentelemetry import trace
 from core.logger_setup import app_logger as logger
 from services.template_integration import TemplateIntegrationService
 import os
@@ -16,20 +21,55 @@ from dotenv import load_dotenv
 from datetime import datetime
 load_dotenv()
 
+@lru_cache(maxsize=1)
+def _read_covers_index():
+    covers_index_path = Path("branding/covers/index.json")
+    with open(covers_index_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 def load_covers_index():
-    """Load the covers index.json file."""
+    """Load the covers index.json file.
+    
+    Parsed once per process and shared between requests, so treat it as read-only;
+    failed loads are not cached. Call _read_covers_index.cache_clear() to reload.
+    """
     try:
-        covers_index_path = Path("branding/covers/index.json")
-        with open(covers_index_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return _read_covers_index()
     except Exception as e:
         logger.error(f"Failed to load covers index: {e}")
         return None
 
 
+COVER_EMBEDDING_MODEL = "text-embedding-3-small"
+
+
+def _unit_vector(values) -> tuple:
+    norm = math.sqrt(sum(v * v for v in values)) or 1.0
+    return tuple(v / norm for v in values)
+
+
+@lru_cache(maxsize=1)
+def _embed_cover_descriptions(descriptions: tuple) -> tuple:
+    """Embed every cover description in one request; reused until the covers change."""
+    response = openai.embeddings.create(model=COVER_EMBEDDING_MODEL, input=list(descriptions))
+    return tuple(_unit_vector(item.embedding) for item in sorted(response.data, key=lambda item: item.index))
+
+
+@lru_cache(maxsize=256)
+def _nearest_cover_index(use_case: str, descriptions: tuple) -> int:
+    """Index of the cover description closest to use_case by cosine similarity; raises on failure so errors aren't cached."""
+    cover_vectors = _embed_cover_descriptions(descriptions)
+    response = openai.embeddings.create(model=COVER_EMBEDDING_MODEL, input=[use_case])
+    query = _unit_vector(response.data[0].embedding)
+    scores = [sum(q * c for q, c in zip(query, vector)) for vector in cover_vectors]
+    return max(range(len(scores)), key=scores.__getitem__)
+
+
 def select_best_cover(use_case: str, covers_index: dict) -> dict:
     """
-    Use LLM to select the most relevant cover based on the use case description.
+    Select the most relevant cover based on the use case description.
+    Uses embedding similarity against the cover descriptions, falling back to an LLM pick.
     
     Args:
         use_case: The presentation topic/use case
@@ -42,6 +82,16 @@ def select_best_cover(use_case: str, covers_index: dict) -> dict:
         logger.warning("No covers available, returning None")
         return None
     
+    # Nearest cover description by embedding; repeated use cases skip the API entirely
+    covers = covers_index['covers']
+    try:
+        descriptions = tuple(cover['description'] for cover in covers)
+        cover = covers[_nearest_cover_index(use_case, descriptions)]
+        logger.info(f"Selected cover {cover['id']} by embedding: {cover['description'][:80]}...")
+        return cover
+    except Exception as e:
+        logger.warning(f"Embedding cover selection failed: {e}, falling back to LLM selection")
+    
     # Create a simplified list of covers for the LLM
     covers_summary = []
     for cover in covers_index['covers']:
@@ -90,6 +140,14 @@ Return ONLY the ID number of the best matching cover (e.g., 5)."""
         return covers_index['covers'][0]
 
 
+@lru_cache(maxsize=None)
+def _read_cover_subtitles(file_name: str) -> dict:
+    """Parse a cover's subtitle JSON once per process; callers must deepcopy before customizing."""
+    subtitle_path = Path("branding/covers/subtitles") / file_name
+    with open(subtitle_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 def load_and_customize_cover(cover_info: dict, presentation_title: str, author_name: str = None) -> dict:
     """
     Load the cover subtitle JSON and customize it with actual data.
@@ -103,10 +161,8 @@ def load_and_customize_cover(cover_info: dict, presentation_title: str, author_n
         Customized cover slide JSON
     """
     try:
-        # Load the subtitle JSON
-        subtitle_path = Path("branding/covers/subtitles") / cover_info['file']
-        with open(subtitle_path, 'r', encoding='utf-8') as f:
-            cover_data = json.load(f)
+        # Load the subtitle JSON (copied, since the parsed file is shared between requests)
+        cover_data = deepcopy(_read_cover_subtitles(cover_info['file']))
         
         # Path to the full-size cover background image
         cover_image_path = f"branding/covers/images/{cover_info['image']}"
@@ -203,10 +259,16 @@ def load_and_customize_cover(cover_info: dict, presentation_title: str, author_n
         return None
 
 
+@lru_cache(maxsize=1)
+def load_ppt_schema():
+    """Parse the deck JSON schema once per process; validate_and_fix and render_pptx only read it."""
+    return json.loads(Path("schemas/ppt-json-schema.json").read_text(encoding="utf-8"))
+
+
 async def process_data_to_ppt(request_id,data):
     deck = data
     try:
-        schema = json.loads(Path("schemas/ppt-json-schema.json").read_text(encoding="utf-8"))
+        schema = load_ppt_schema()
     except Exception as e:
         logger.error(str(e))
         print(traceback.format_exc())
@@ -227,16 +289,9 @@ async def process_data_to_ppt(request_id,data):
 
 
 
-def extract_presentation_info(user_input: str) -> dict:
-    """
-    Extract presentation title and use case from user input using LLM.
-    
-    Args:
-        user_input: The user's presentation request
-        
-    Returns:
-        Dictionary with 'title', 'use_case', and optional 'author'
-    """
+@lru_cache(maxsize=256)
+def _extract_presentation_info_llm(user_input: str) -> dict:
+    """LLM extraction behind extract_presentation_info; raises on failure so errors aren't cached."""
     extraction_prompt = f"""Extract the following information from the user's presentation request and return ONLY a valid JSON object:
 
 1. presentation_title: A concise, professional title for the presentation (max 10 words)
@@ -253,24 +308,39 @@ Return ONLY the JSON object in this exact format:
   "author": "..." or null
 }}"""
 
-    try:
-        response = openai.chat.completions.create(
-            model="gpt-4.1-mini",
-            messages=[
-                {"role": "system", "content": "You are a helpful assistant that extracts structured information from text."},
-                {"role": "user", "content": extraction_prompt}
-            ],
-            temperature=0.1,
-            max_tokens=200,
-        )
-        
-        content = response.choices[0].message.content.strip()
-        if content.startswith("```"):
-            content = content.strip().lstrip("```json").lstrip("```").rstrip("```").strip()
+    response = openai.chat.completions.create(
+        model="gpt-4.1-mini",
+        messages=[
+            {"role": "system", "content": "You are a helpful assistant that extracts structured information from text."},
+            {"role": "user", "content": extraction_prompt}
+        ],
+        temperature=0.1,
+        max_tokens=200,
+    )
+    
+    content = response.choices[0].message.content.strip()
+    if content.startswith("```"):
+        content = content.strip().lstrip("```json").lstrip("```").rstrip("```").strip()
+    
+    info = json.loads(content)
+    logger.info(f"Extracted presentation info: {info}")
+    return info
+
+
+def extract_presentation_info(user_input: str) -> dict:
+    """
+    Extract presentation title and use case from user input using LLM.
+    Identical requests reuse the previous extraction.
+    
+    Args:
+        user_input: The user's presentation request
         
-        info = json.loads(content)
-        logger.info(f"Extracted presentation info: {info}")
-        return info
+    Returns:
+        Dictionary with 'title', 'use_case', and optional 'author'
+    """
+    try:
+        # Copy so callers can't modify the cached result
+        return dict(_extract_presentation_info_llm(user_input))
         
     except Exception as e:
         logger.error(f"Error extracting presentation info: {e}")
@@ -282,11 +352,89 @@ Return ONLY the JSON object in this exact format:
         }
 
 
-def call_llm(response, include_cover: bool = True):
+def record_prompt_cache_usage(usage):
+    """Log how much of the prompt the provider served from its prompt cache and
+    attach the counts to the current trace span."""
+    details = getattr(usage, 'prompt_tokens_details', None)
+    cached_tokens = getattr(details, 'cached_tokens', None) or 0
+    prompt_tokens = usage.prompt_tokens or 0
+    hit_rate = cached_tokens / prompt_tokens if prompt_tokens else 0.0
+    logger.info(f"Prompt cache: {cached_tokens}/{prompt_tokens} prompt tokens cached ({hit_rate:.0%})")
+    
+    span = trace.get_current_span()
+    span.set_attribute("gen_ai.usage.input_tokens", prompt_tokens)
+    span.set_attribute("gen_ai.usage.input_cache_read_tokens", cached_tokens)
+
+
+def build_cover_slide(response) -> dict:
+    """
+    Extract presentation info from the user input, select the best cover and customize it.
+    
+    Args:
+        response: The user input/information for generating the presentation
+    
+    Returns:
+        Customized cover slide JSON, or None if no cover could be built
+    """
+    cover_slide = None
+    try:
+        logger.info("Extracting presentation information for cover selection...")
+        pres_info = extract_presentation_info(response)
+        
+        logger.info("Loading covers index...")
+        covers_index = load_covers_index()
+        
+        if covers_index:
+            logger.info("Selecting best cover based on use case...")
+            selected_cover = select_best_cover(pres_info['use_case'], covers_index)
+            
+            if selected_cover:
+                logger.info(f"Customizing cover slide with title: {pres_info['presentation_title']}")
+                cover_slide = load_and_customize_cover(
+                    selected_cover,
+                    pres_info['presentation_title'],
+                    pres_info.get('author')
+                )
+                
+                if cover_slide:
+                    logger.info("✓ Cover slide successfully created and customized")
+                else:
+                    logger.warning("Failed to customize cover slide")
+            else:
+                logger.warning("No cover selected")
+        else:
+            logger.warning("Covers index not loaded")
+            
+    except Exception as e:
+        logger.error(f"Error in cover selection process: {e}\n{traceback.format_exc()}")
+        # Continue without cover if there's an error
+    
+    return cover_slide
+
+
+def create_slides_completion(prompt: str):
+    """Run the main gpt-4.1 completion that generates the presentation JSON."""
+    return openai.chat.completions.create(
+        model="gpt-4.1",
+        messages=[
+            {"role": "system", "content": "You are a helpful assistant for generating PPT JSON presentations."},
+            {"role": "user", "content": prompt}
+        ],
+        # JSON mode: the reply is always a syntactically valid JSON object
+        response_format={"type": "json_object"},
+        # temperature=0.2,
+        # max_tokens=4000,
+    )
+
+
+async def call_llm(response, include_cover: bool = True):
     """
     Calls OpenAI LLM to generate a valid JSON PPT using the LLM_PROMPT and the provided response as input_information.
     Intelligently selects and prepends a cover slide based on the presentation content.
     
+    The cover pipeline only needs the raw user input, so its LLM calls run in a
+    worker thread alongside the main generation instead of before it.
+    
     Args:
         response: The user input/information for generating the presentation
         include_cover: Whether to include an intelligent cover page (default: True)
@@ -297,60 +445,27 @@ def call_llm(response, include_cover: bool = True):
     
     cover_slide = None
     
-    # Step 1: Extract presentation info and select cover if enabled
-    if include_cover:
-        try:
-            logger.info("Extracting presentation information for cover selection...")
-            pres_info = extract_presentation_info(response)
-            
-            logger.info("Loading covers index...")
-            covers_index = load_covers_index()
-            
-            if covers_index:
-                logger.info("Selecting best cover based on use case...")
-                selected_cover = select_best_cover(pres_info['use_case'], covers_index)
-                
-                if selected_cover:
-                    logger.info(f"Customizing cover slide with title: {pres_info['presentation_title']}")
-                    cover_slide = load_and_customize_cover(
-                        selected_cover,
-                        pres_info['presentation_title'],
-                        pres_info.get('author')
-                    )
-                    
-                    if cover_slide:
-                        logger.info("✓ Cover slide successfully created and customized")
-                    else:
-                        logger.warning("Failed to customize cover slide")
-                else:
-                    logger.warning("No cover selected")
-            else:
-                logger.warning("Covers index not loaded")
-                
-        except Exception as e:
-            logger.error(f"Error in cover selection process: {e}\n{traceback.format_exc()}")
-            # Continue without cover if there's an error
-
-    # Step 2: Generate the main presentation content with template examples
+    # Steps 1 & 2: cover selection and main presentation generation, run concurrently
     try:
         logger.info("Building prompt with template examples...")
         prompt = build_prompt_with_templates(response)
         logger.info("Generating main presentation slides...")
-        completion = openai.chat.completions.create(
-            model="gpt-4.1",
-            messages=[
-                {"role": "system", "content": "You are a helpful assistant for generating PPT JSON presentations."},
-                {"role": "user", "content": prompt}
-            ],
-            # temperature=0.2,
-            # max_tokens=4000,
-        )
+        generation = asyncio.to_thread(create_slides_completion, prompt)
+        
+        if include_cover:
+            cover_slide, completion = await asyncio.gather(
+                asyncio.to_thread(build_cover_slide, response),
+                generation
+            )
+        else:
+            completion = await generation
         
         # Print tokens used in the completion call if available
         try:
             usage = getattr(completion, 'usage', None)
             if usage:
                 logger.info(f"OpenAI completion token usage: {usage}")
+                record_prompt_cache_usage(usage)
         except Exception as token_exc:
             logger.warning(f"Could not print token usage: {token_exc}")
 
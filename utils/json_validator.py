@@ -129,6 +129,28 @@ def _overlaps(a: Tuple[int,int,int,int], b: Tuple[int,int,int,int]) -> bool:
     bx1, by1, bx2, by2 = b
     return not (ax2 <= bx1 or ax1 >= bx2 or ay2 <= by1 or ay1 >= by2)
 
+# ---------- Schema validators ----------
+
+# Compiled validators keyed by id() of the schema object. Each entry keeps a
+# reference to its schema so the id can't be reused while it is cached.
+# The schema is assumed not to be mutated after first use (load_ppt_schema
+# hands out one shared, read-only dict per process).
+_VALIDATORS: Dict[int, Tuple[Dict[str, Any], Draft7Validator]] = {}
+MAX_CACHED_VALIDATORS = 16
+
+def get_validator(schema_json: Dict[str, Any]) -> Draft7Validator:
+    """Return a Draft-07 validator for schema_json, checked and built once per schema object."""
+    entry = _VALIDATORS.get(id(schema_json))
+    if entry is not None:
+        return entry[1]
+    Draft7Validator.check_schema(schema_json)
+    validator = Draft7Validator(schema_json)
+    if len(_VALIDATORS) >= MAX_CACHED_VALIDATORS:
+        # Callers building a fresh schema per call: don't grow without bound
+        _VALIDATORS.clear()
+    _VALIDATORS[id(schema_json)] = (schema_json, validator)
+    return validator
+
 # ---------- Core: validate + fix ----------
 
 def validate_and_fix(deck_json: Dict[str, Any], schema_json: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
@@ -140,7 +162,7 @@ def validate_and_fix(deck_json: Dict[str, Any], schema_json: Dict[str, Any]) ->
     deck = deepcopy(deck_json)
 
     # 0) Basic schema validation (structure). We still proceed to autofix/layout checks.
-    validator = Draft7Validator(schema_json)
+    validator = get_validator(schema_json)
     errs = sorted(validator.iter_errors(deck), key=lambda e: e.path)
     hard_fail = []
     for e in errs:
@@ -18,7 +18,8 @@ import argparse, json, math, os, sys
 from pathlib import Path
 from typing import Dict, Any, Tuple, List, Optional
 from core.logger_setup import app_logger as logger
-from jsonschema import validate as jsonschema_validate, Draft7Validator
+from utils.json_validator import get_validator
+from jsonschema import validate as jsonschema_validate
 from pptx import Presentation
 from pptx.util import Emu, Pt, Inches
 from pptx.enum.text import PP_PARAGRAPH_ALIGNMENT, MSO_AUTO_SIZE
@@ -813,8 +814,8 @@ def adjust_spoke_to_circle(line, siblings, prs=None, tokens=None):
     return line
 
 def render_pptx(doc: Dict[str, Any], schema: Dict[str, Any], out_path: Path):
-    # Validate
-    validator = Draft7Validator(schema)
+    # Validate (validator built once per schema object; a cache hit is a dict lookup)
+    validator = get_validator(schema)
     errs = sorted(validator.iter_errors(doc), key=lambda e: e.path)
     if errs:
         for e in errs:
@@ -828,8 +829,9 @@ def render_pptx(doc: Dict[str, Any], schema: Dict[str, Any], out_path: Path):
     prs = Presentation()
     slide_set_size(prs, deck.get("slide_size", "16x9"))
 
+    blank_layout = prs.slide_layouts[6]  # blank
     for s in doc["slides"]:
-        slide = prs.slides.add_slide(prs.slide_layouts[6])  # blank
+        slide = prs.slides.add_slide(blank_layout)
         apply_background(slide, tokens, s.get("background"))
         apply_watermark(slide, deck)  # behind content visually (approx)
 